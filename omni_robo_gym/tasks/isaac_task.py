@@ -51,6 +51,61 @@ from typing import List, Dict
 from SharsorIPCpp.PySharsorIPC import LogType
 from SharsorIPCpp.PySharsorIPC import Journal
 
+def _diff_states(p, p_prev, 
+        q, q_prev, 
+        jq, jq_prev, 
+        dt: float, 
+        v_out: torch.Tensor, 
+        omega_out: torch.Tensor, 
+        jv_out: torch.Tensor):
+
+    # numerical differentiation of the root position, root orientation 
+    # and joint positions. Results are written in place into the provided
+    # output tensors, so that no intermediate tensors are allocated
+
+    torch.sub(p, p_prev, out=v_out).div_(dt)
+    quat_to_omega(q, q_prev, dt, out=omega_out)
+    torch.sub(jq, jq_prev, out=jv_out).div_(dt)
+
+    return v_out, omega_out, jv_out
+
+def _assemble_uniform_gains(pos_buf: torch.Tensor, 
+        vel_buf: torch.Tensor, 
+        n_envs: int, 
+        stiffness: float, 
+        damping: float):
+
+    # fills the first n_envs rows of the provided gain buffers with 
+    # uniform values (no allocation) and returns them
+    gains_pos = pos_buf[:n_envs, :]
+    gains_vel = vel_buf[:n_envs, :]
+    gains_pos.fill_(stiffness)
+    gains_vel.fill_(damping)
+
+    return gains_pos, gains_vel
+
+def _validate_bool_list(name: str, 
+        flags: List[bool], 
+        n: int):
+
+    # returns the flags as a (n,) boolean array (all False if not provided)
+    if flags is None:
+        return np.zeros((n,), dtype=bool)
+    flags = np.asarray(flags, dtype=bool)
+    if flags.shape != (n,):
+        exception = f"The provided {name} list of boolean must match the length " + \
+            "of the provided robot package names"
+        raise Exception(exception)
+    return flags
+
+def _validate_positive_int(name: str, 
+        value: int):
+
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value <= 0:
+        exception = f"The provided {name} should be a positive integer, got {value}"
+        raise Exception(exception)
+    return value
+
 class IsaacTask(BaseTask):
 
     def __init__(self, 
@@ -75,12 +130,13 @@ class IsaacTask(BaseTask):
                 env_spacing = 5.0, 
                 spawning_radius = 1.0,
                 use_flat_ground = True,
+                terrain_cache_dir: str = None,
                 default_jnt_stiffness = 300.0,
                 default_jnt_damping = 20.0,
                 default_wheel_stiffness = 0.0,
                 default_wheel_damping = 10.0,
                 override_art_controller = False,
-                dtype = torch.float64,
+                dtype = torch.float32,
                 debug_enabled: bool = False,
                 verbose = False,
                 use_diff_velocities = False) -> None:
@@ -101,6 +157,9 @@ class IsaacTask(BaseTask):
         
         self.torch_device = torch.device(device) # defaults to "cuda" ("cpu" also valid)
 
+        # factory kwargs shared by all tensors created by the task
+        self._tkw = {"device": self.torch_device, "dtype": self.torch_dtype}
+
         self.using_gpu = False
         if self.torch_device == torch.device("cuda"):
             self.using_gpu = True
@@ -118,36 +177,15 @@ class IsaacTask(BaseTask):
                 exception = "The provided robot names list must match the length " + \
                     "of the provided robot package names"
                 raise Exception(exception)
-        if fix_base is None:
-            self._fix_base = [False] * len(self.robot_names)
-        else:
-            # check dimension consistency
-            if len(fix_base) != len(robot_pkg_names):
-                exception = "The provided fix_base list of boolean must match the length " + \
-                    "of the provided robot package names"
-                raise Exception(exception)
-            self._fix_base = fix_base 
-        
-        if self_collide is None:
-            self._self_collide = [False] * len(self.robot_names)
-        else:
-            # check dimension consistency
-            if len(self_collide) != len(robot_pkg_names):
-                exception = "The provided self_collide list of boolean must match the length " + \
-                    "of the provided robot package names"
-                raise Exception(exception)
-            self._self_collide = self_collide 
-        
-        if merge_fixed is None:
-            self._merge_fixed = [False] * len(self.robot_names)
-        else:
-            # check dimension consistency
-            if len(merge_fixed) != len(robot_pkg_names):
-                exception = "The provided merge_fixed list of boolean must match the length " + \
-                    "of the provided robot package names"
-                raise Exception(exception)
-            
-            self._merge_fixed = merge_fixed 
+        # per-robot import flags, stored as a single (n_robots, 3) boolean array
+        # with columns [fix_base, self_collide, merge_fixed] (all False by default)
+        n_robots = len(self.robot_names)
+        self._robot_flags = np.stack((_validate_bool_list("fix_base", fix_base, n_robots), 
+                                _validate_bool_list("self_collide", self_collide, n_robots), 
+                                _validate_bool_list("merge_fixed", merge_fixed, n_robots)), axis=1)
+        self._fix_base = self._robot_flags[:, 0]
+        self._self_collide = self._robot_flags[:, 1]
+        self._merge_fixed = self._robot_flags[:, 2]
 
         self._urdf_paths = {}
         self._srdf_paths = {}
@@ -155,9 +193,11 @@ class IsaacTask(BaseTask):
         self._robots_articulations = {}
         self._robots_geom_prim_views = {}
         
-        self._solver_position_iteration_count = solver_position_iteration_count # solver position iteration count
+        self._solver_position_iteration_count = _validate_positive_int("solver_position_iteration_count", 
+                                                    solver_position_iteration_count) # solver position iteration count
         # -> higher number makes simulation more accurate
-        self._solver_velocity_iteration_count = solver_velocity_iteration_count
+        self._solver_velocity_iteration_count = _validate_positive_int("solver_velocity_iteration_count", 
+                                                    solver_velocity_iteration_count)
         self._solver_stabilization_thresh = solver_stabilization_thresh # threshold for kin. energy below which an articulatiion
         # "goes to sleep", i.e. it's not simulated anymore until some action wakes him up
         # potentially, each robot could have its own setting for the solver (not supported yet)
@@ -189,6 +229,14 @@ class IsaacTask(BaseTask):
 
         self._jnts_eff_default = {}
 
+        self._homing_zero = {} # persistent zero vel./effort buffers for the homing, (num_envs, n_dofs)
+
+        self._gains_pos_buf = {} # persistent gain buffers, (num_envs, n_dofs)
+        self._gains_vel_buf = {}
+        self._wheel_pos_buf = {} # (num_envs, n_wheels)
+        self._wheel_vel_buf = {}
+        self._wheels_idxs = {} # indexes of wheel joints (None if the robot has no wheels)
+
         self._root_pos_offsets = {} 
         self._root_q_offsets = {} 
 
@@ -205,6 +253,8 @@ class IsaacTask(BaseTask):
         self.default_wheel_damping = default_wheel_damping
         
         self.use_flat_ground = use_flat_ground
+        self._terrain_cache_dir = terrain_cache_dir # if not None, generated terrain meshes 
+        # are cached on disk (see RlTerrains)
         
         self.spawning_radius = spawning_radius # [m] -> default distance between roots of robots in a single 
         # environment 
@@ -221,7 +271,7 @@ class IsaacTask(BaseTask):
                                                 self.num_envs)
         self._cloning_offset = cloning_offset
         if self._cloning_offset is None:
-            self._cloning_offset = np.array([[0, 0, 0]] * self.num_envs)
+            self._cloning_offset = np.zeros((self.num_envs, 3)) # consumed on host by the cloner
 
         self._replicate_physics = replicate_physics
 
@@ -254,6 +304,12 @@ class IsaacTask(BaseTask):
         self.xrdf_cmd_vals = [] # by default empty, needs to be overriden by
         # child class
 
+        self._xrdf_cmds_cache = None # filled when configuring the scene
+
+        import rospkg
+        self._rospack = rospkg.RosPack() # shared by all robots, so that 
+        # package lookups are cached across description generations
+
     def update_jnt_imp_control_gains(self, 
                     robot_name: str,
                     jnt_stiffness: float, 
@@ -290,67 +346,39 @@ class IsaacTask(BaseTask):
                             error,
                             LogType.EXCEP,
                             True)
-                for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
+                if self._verbose:
+                    for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
             if self._verbose:
                 Journal.log(self.__class__.__name__,
                             "update_jnt_imp_control_gains",
                             f"updating joint impedances " + for_robots,
                             LogType.STAT,
                             throw_when_excep = True)
+        # gains are written into persistent buffers (only the first n rows are 
+        # used when updating a subset of envs)
+        n_envs = self.num_envs if env_indxs is None else env_indxs.shape[0]
+        jnt_imp_cntrl = self.jnt_imp_controllers[robot_name]
         # set jnt imp gains for the whole robot
-        if env_indxs is None:           
-            gains_pos = torch.full((self.num_envs, \
-                                    self.jnt_imp_controllers[robot_name].n_dofs), 
-                        jnt_stiffness, 
-                        device = self.torch_device, 
-                        dtype=self.torch_dtype)
-            gains_vel = torch.full((self.num_envs, \
-                                    self.jnt_imp_controllers[robot_name].n_dofs), 
-                        jnt_damping, 
-                        device = self.torch_device, 
-                        dtype=self.torch_dtype)
-        else:
-            gains_pos = torch.full((env_indxs.shape[0], \
-                                    self.jnt_imp_controllers[robot_name].n_dofs), 
-                        jnt_stiffness, 
-                        device = self.torch_device, 
-                        dtype=self.torch_dtype)
-            gains_vel = torch.full((env_indxs.shape[0], \
-                                    self.jnt_imp_controllers[robot_name].n_dofs), 
-                        jnt_damping, 
-                        device = self.torch_device, 
-                        dtype=self.torch_dtype)
-        self.jnt_imp_controllers[robot_name].set_gains(
+        gains_pos, gains_vel = _assemble_uniform_gains(self._gains_pos_buf[robot_name], 
+                                    self._gains_vel_buf[robot_name], 
+                                    n_envs, 
+                                    jnt_stiffness, 
+                                    jnt_damping)
+        jnt_imp_cntrl.set_gains(
                 pos_gains = gains_pos,
                 vel_gains = gains_vel,
                 robot_indxs = env_indxs)
         
         # in case of wheels
-        wheels_indxs = self.jnt_imp_controllers[robot_name].get_jnt_idxs_matching(
-                                name_pattern="wheel")
+        wheels_indxs = self._wheels_idxs[robot_name] # cached at init (None if no wheels)
         if wheels_indxs is not None:
-            if env_indxs is None:           
-                # wheels are velocity-controlled
-                wheels_pos_gains = torch.full((self.num_envs, len(wheels_indxs)), 
-                                            wheel_stiffness, 
-                                            device = self.torch_device, 
-                                            dtype=self.torch_dtype)
-                wheels_vel_gains = torch.full((self.num_envs, len(wheels_indxs)), 
-                                            wheel_damping, 
-                                            device = self.torch_device, 
-                                            dtype=self.torch_dtype)
-            else:
-                # wheels are velocity-controlled
-                wheels_pos_gains = torch.full((env_indxs.shape[0], len(wheels_indxs)), 
-                                            wheel_stiffness, 
-                                            device = self.torch_device, 
-                                            dtype=self.torch_dtype)
-                
-                wheels_vel_gains = torch.full((env_indxs.shape[0], len(wheels_indxs)), 
-                                            wheel_damping, 
-                                            device = self.torch_device, 
-                                            dtype=self.torch_dtype)
-            self.jnt_imp_controllers[robot_name].set_gains(
+            # wheels are velocity-controlled
+            wheels_pos_gains, wheels_vel_gains = _assemble_uniform_gains(self._wheel_pos_buf[robot_name], 
+                                    self._wheel_vel_buf[robot_name], 
+                                    n_envs, 
+                                    wheel_stiffness, 
+                                    wheel_damping)
+            jnt_imp_cntrl.set_gains(
                     pos_gains = wheels_pos_gains,
                     vel_gains = wheels_vel_gains,
                     jnt_indxs=wheels_indxs,
@@ -386,7 +414,8 @@ class IsaacTask(BaseTask):
                             error,
                             LogType.EXCEP,
                             True)
-                for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
+                if self._verbose:
+                    for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
             if self._verbose:
                 Journal.log(self.__class__.__name__,
                     "update_root_offsets",
@@ -397,7 +426,7 @@ class IsaacTask(BaseTask):
         # only planar position used
         if env_indxs is None:
             self._root_pos_offsets[robot_name][:, 0:2]  = self._root_p[robot_name][:, 0:2]
-            self._root_q_offsets[robot_name][:, :]  = self._root_q[robot_name]
+            self._root_q_offsets[robot_name].copy_(self._root_q[robot_name])
         else:
             self._root_pos_offsets[robot_name][env_indxs, 0:2]  = self._root_p[robot_name][env_indxs, 0:2]
             self._root_q_offsets[robot_name][env_indxs, :]  = self._root_q[robot_name][env_indxs, :]
@@ -432,7 +461,8 @@ class IsaacTask(BaseTask):
                             error,
                             LogType.EXCEP,
                             True)  
-                for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
+                if self._verbose:
+                    for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs.tolist())
             if self._verbose:
                 Journal.log(self.__class__.__name__,
                             "synch_default_root_states",
@@ -441,8 +471,8 @@ class IsaacTask(BaseTask):
                             throw_when_excep = True)
 
         if env_indxs is None:
-            self._root_p_default[robot_name][:, :] = self._root_p[robot_name]
-            self._root_q_default[robot_name][:, :] = self._root_q[robot_name]
+            self._root_p_default[robot_name].copy_(self._root_p[robot_name])
+            self._root_q_default[robot_name].copy_(self._root_q[robot_name])
         else:
             self._root_p_default[robot_name][env_indxs, :] = self._root_p[robot_name][env_indxs, :]
             self._root_q_default[robot_name][env_indxs, :] = self._root_q[robot_name][env_indxs, :]
@@ -520,7 +550,8 @@ class IsaacTask(BaseTask):
                             error,
                             LogType.EXCEP,
                             True)
-                for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs)
+                if self._verbose:
+                    for_robots = f"for robot {robot_name}, indexes: " + str(env_indxs)
                                 
             if self._verbose:
                 Journal.log(self.__class__.__name__,
@@ -529,18 +560,23 @@ class IsaacTask(BaseTask):
                     LogType.STAT,
                     throw_when_excep = True)
 
+        jnt_imp_cntrl = self.jnt_imp_controllers[robot_name]
+        homing = self.homers[robot_name].get_homing()
+        jnts_q = self._jnts_q[robot_name]
+        jnts_v = self._jnts_v[robot_name]
+
         # resets all internal data, refs to defaults
-        self.jnt_imp_controllers[robot_name].reset(robot_indxs = env_indxs)
+        jnt_imp_cntrl.reset(robot_indxs = env_indxs)
 
         # restore current state
         if env_indxs is None:
-            self.jnt_imp_controllers[robot_name].update_state(pos = self._jnts_q[robot_name][:, :], 
-                vel = self._jnts_v[robot_name][:, :],
+            jnt_imp_cntrl.update_state(pos = jnts_q, 
+                vel = jnts_v,
                 eff = None,
                 robot_indxs = None)
         else:
-            self.jnt_imp_controllers[robot_name].update_state(pos = self._jnts_q[robot_name][env_indxs, :], 
-                vel = self._jnts_v[robot_name][env_indxs, :],
+            jnt_imp_cntrl.update_state(pos = jnts_q[env_indxs, :], 
+                vel = jnts_v[env_indxs, :],
                 eff = None,
                 robot_indxs = env_indxs)
         
@@ -554,10 +590,10 @@ class IsaacTask(BaseTask):
         
         #restore jnt imp refs to homing            
         if env_indxs is None:                               
-            self.jnt_imp_controllers[robot_name].set_refs(pos_ref=self.homers[robot_name].get_homing()[:, :],
+            jnt_imp_cntrl.set_refs(pos_ref=homing,
                                                     robot_indxs = None)
         else:
-            self.jnt_imp_controllers[robot_name].set_refs(pos_ref=self.homers[robot_name].get_homing()[env_indxs, :],
+            jnt_imp_cntrl.set_refs(pos_ref=homing[env_indxs, :],
                                                             robot_indxs = env_indxs)
 
         # actually applies reset commands to the articulation
@@ -595,14 +631,11 @@ class IsaacTask(BaseTask):
                 throw_when_excep = True)
 
         if not self.scene_setup_completed:
-            for i in range(len(self.robot_names)):
-                robot_name = self.robot_names[i]
-                robot_pkg_name = self.robot_pkg_names[i]
-                fix_base = self._fix_base[i]
-                self_collide = self._self_collide[i]
-                merge_fixed = self._merge_fixed[i]
-                self._generate_rob_descriptions(robot_name=robot_name, 
-                                        robot_pkg_name=robot_pkg_name)
+            self._xrdf_cmds_cache = self._xrdf_cmds() # user-defined, so we only call it once
+            # for all robots
+            self._generate_all_descriptions()
+            for robot_name, robot_flags in zip(self.robot_names, self._robot_flags.tolist()):
+                fix_base, self_collide, merge_fixed = robot_flags
                 self._import_urdf(robot_name, 
                                 fix_base=fix_base, 
                                 self_collide=self_collide, 
@@ -623,8 +656,7 @@ class IsaacTask(BaseTask):
                         "finishing scene setup...",
                         LogType.STAT,
                         throw_when_excep = True)
-            for i in range(len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 self._robots_art_views[robot_name] = ArticulationView(name = robot_name + "ArtView",
                                                             prim_paths_expr = self._env_ns + "/env_.*"+ "/" + robot_name + "/base_link", 
                                                             reset_xform_properties=False)
@@ -643,7 +675,8 @@ class IsaacTask(BaseTask):
                             dynamic_friction=1.0, 
                             restitution=0.2)
             else:
-                self.terrains = RlTerrains(get_current_stage())
+                self.terrains = RlTerrains(get_current_stage(), 
+                                    cache_dir=self._terrain_cache_dir)
                 self.terrains.get_obstacles_terrain(terrain_size=40, 
                                             num_obs=100, 
                                             max_height=0.4, 
@@ -676,8 +709,8 @@ class IsaacTask(BaseTask):
         self.reset_state(env_indxs=env_indxs, 
                     robot_names=rob_names)
         # and jnt imp. controllers
-        for i in range(len(rob_names)):
-            self.reset_jnt_imp_control(robot_name=rob_names[i],
+        for robot_name in rob_names:
+            self.reset_jnt_imp_control(robot_name=robot_name,
                                 env_indxs=env_indxs)
 
     def reset_state(self,
@@ -703,8 +736,7 @@ class IsaacTask(BaseTask):
                             error,
                             LogType.EXCEP,
                             True)
-            for i in range(len(rob_names)):
-                robot_name = rob_names[i]
+            for robot_name in rob_names:
                 # root q
                 self._robots_art_views[robot_name].set_world_poses(positions = self._root_p_default[robot_name][env_indxs, :],
                                                     orientations=self._root_q_default[robot_name][env_indxs, :],
@@ -724,27 +756,31 @@ class IsaacTask(BaseTask):
                 self._robots_art_views[robot_name].set_joint_efforts(efforts = self._jnts_eff_default[robot_name][env_indxs, :],
                                                         indices = env_indxs)
         else:
-            for i in range(len(rob_names)):
-                robot_name = rob_names[i]
+            for robot_name in rob_names:
                 # root q
-                self._robots_art_views[robot_name].set_world_poses(positions = self._root_p_default[robot_name][:, :],
-                                                    orientations=self._root_q_default[robot_name][:, :],
+                self._robots_art_views[robot_name].set_world_poses(positions = self._root_p_default[robot_name],
+                                                    orientations=self._root_q_default[robot_name],
                                                     indices = None)
                 # jnts q
-                self._robots_art_views[robot_name].set_joint_positions(positions = self._jnts_q_default[robot_name][:, :],
+                self._robots_art_views[robot_name].set_joint_positions(positions = self._jnts_q_default[robot_name],
                                                         indices = None)
                 # root v and omega
-                self._robots_art_views[robot_name].set_joint_velocities(velocities = self._jnts_v_default[robot_name][:, :],
+                self._robots_art_views[robot_name].set_joint_velocities(velocities = self._jnts_v_default[robot_name],
                                                         indices = None)
                 # jnts v
-                concatenated_vel = torch.cat((self._root_v_default[robot_name][:, :], 
-                                                self._root_omega_default[robot_name][:, :]), dim=1)
+                concatenated_vel = torch.cat((self._root_v_default[robot_name], 
+                                                self._root_omega_default[robot_name]), dim=1)
                 self._robots_art_views[robot_name].set_velocities(velocities = concatenated_vel,
                                                         indices = None)
                 # jnts eff
-                self._robots_art_views[robot_name].set_joint_efforts(efforts = self._jnts_eff_default[robot_name][:, :],
+                self._robots_art_views[robot_name].set_joint_efforts(efforts = self._jnts_eff_default[robot_name],
                                                         indices = None)
 
+        # setting the joint positions also overwrites the PD targets of the articulations
+        for robot_name in rob_names:
+            if robot_name in self.jnt_imp_controllers:
+                self.jnt_imp_controllers[robot_name].invalidate_refs()
+
         # we update the robots state 
         self.get_states(env_indxs=env_indxs, 
                         robot_names=rob_names)
@@ -907,92 +943,87 @@ class IsaacTask(BaseTask):
         # on specific needs
         pass
 
-    def _generate_srdf(self, 
+    def _get_srdf_xacro_cmd(self, 
                 robot_name: str, 
                 robot_pkg_name: str):
         
-        # we generate the URDF where the description package is located
-        import rospkg
-        rospackage = rospkg.RosPack()
-        descr_path = rospackage.get_path(robot_pkg_name + "_srdf")
+        # we generate the SRDF where the description package is located
+        descr_path = self._rospack.get_path(robot_pkg_name + "_srdf")
         srdf_path = descr_path + "/srdf"
         xacro_name = robot_pkg_name
         xacro_path = srdf_path + "/" + xacro_name + ".srdf.xacro"
         self._srdf_paths[robot_name] = self._descr_dump_path + "/" + robot_name + ".srdf"
 
-        if self._xrdf_cmds() is not None:
-            cmds = self._xrdf_cmds()[robot_name]
+        cmds_dict = self._xrdf_cmds_cache
+        if cmds_dict is not None:
+            cmds = cmds_dict[robot_name]
             if cmds is None:
                 xacro_cmd = ["xacro"] + [xacro_path] + ["-o"] + [self._srdf_paths[robot_name]]
             else:
                 xacro_cmd = ["xacro"] + [xacro_path] + cmds + ["-o"] + [self._srdf_paths[robot_name]]
 
-        if self._xrdf_cmds() is None:
+        if cmds_dict is None:
             xacro_cmd = ["xacro"] + [xacro_path] + ["-o"] + [self._srdf_paths[robot_name]]
 
-        import subprocess
-        try:
-            xacro_gen = subprocess.check_call(xacro_cmd)
-        except:
-            Journal.log(self.__class__.__name__,
-                "_generate_urdf",
-                "failed to generate " + robot_name + "\'S SRDF!!!",
-                LogType.EXCEP,
-                throw_when_excep = True)
+        return xacro_cmd
         
-    def _generate_urdf(self, 
+    def _get_urdf_xacro_cmd(self, 
                 robot_name: str, 
                 robot_pkg_name: str):
 
         # we generate the URDF where the description package is located
-        import rospkg
-        rospackage = rospkg.RosPack()
-        descr_path = rospackage.get_path(robot_pkg_name + "_urdf")
+        descr_path = self._rospack.get_path(robot_pkg_name + "_urdf")
         urdf_path = descr_path + "/urdf"
         xacro_name = robot_pkg_name
         xacro_path = urdf_path + "/" + xacro_name + ".urdf.xacro"
         self._urdf_paths[robot_name] = self._descr_dump_path + "/" + robot_name + ".urdf"
         
-        if self._xrdf_cmds() is not None:
-            cmds = self._xrdf_cmds()[robot_name]
+        cmds_dict = self._xrdf_cmds_cache
+        if cmds_dict is not None:
+            cmds = cmds_dict[robot_name]
             if cmds is None:
                 xacro_cmd = ["xacro"] + [xacro_path] + ["-o"] + [self._urdf_paths[robot_name]]
             else:
                 xacro_cmd = ["xacro"] + [xacro_path] + cmds + ["-o"] + [self._urdf_paths[robot_name]]
-        if self._xrdf_cmds() is None:
+        if cmds_dict is None:
             xacro_cmd = ["xacro"] + [xacro_path] + ["-o"] + [self._urdf_paths[robot_name]]
 
-        import subprocess
-        try:
-            xacro_gen = subprocess.check_call(xacro_cmd)
-            # we also generate an updated SRDF
-        except:
-            Journal.log(self.__class__.__name__,
-                "_generate_urdf",
-                "Failed to generate " + robot_name + "\'s URDF!!!",
-                LogType.EXCEP,
-                throw_when_excep = True)
+        return xacro_cmd
 
-    def _generate_rob_descriptions(self, 
-                    robot_name: str, 
-                    robot_pkg_name: str):
+    def _generate_all_descriptions(self):
         
+        # generates URDF and SRDF (useful for control) files for all robots. 
+        # xacro runs are independent external processes, so they are launched concurrently
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor
+
         self._descr_dump_path = "/tmp/" + f"{self.__class__.__name__}"
-        Journal.log(self.__class__.__name__,
-                    "update_root_offsets",
-                    "generating URDF for robot "+ f"{robot_name}, of type {robot_pkg_name}...",
-                    LogType.STAT,
-                    throw_when_excep = True)
-        self._generate_urdf(robot_name=robot_name, 
-                        robot_pkg_name=robot_pkg_name)
-        Journal.log(self.__class__.__name__,
-                    "update_root_offsets",
-                    "generating SRDF for robot "+ f"{robot_name}, of type {robot_pkg_name}...",
+
+        jobs = [] # (description, xacro command)
+        for robot_name, robot_pkg_name in zip(self.robot_names, self.robot_pkg_names):
+            Journal.log(self.__class__.__name__,
+                    "_generate_all_descriptions",
+                    "generating URDF and SRDF for robot "+ f"{robot_name}, of type {robot_pkg_name}...",
                     LogType.STAT,
                     throw_when_excep = True)
-        # we also generate SRDF files, which are useful for control
-        self._generate_srdf(robot_name=robot_name, 
-                        robot_pkg_name=robot_pkg_name)
+            jobs.append((robot_name + "\'s URDF", 
+                    self._get_urdf_xacro_cmd(robot_name=robot_name, 
+                                        robot_pkg_name=robot_pkg_name)))
+            jobs.append((robot_name + "\'s SRDF", 
+                    self._get_srdf_xacro_cmd(robot_name=robot_name, 
+                                        robot_pkg_name=robot_pkg_name)))
+
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = [executor.submit(subprocess.check_call, job[1]) for job in jobs]
+            # waiting for all generations to complete before checking for failures
+            failed = [jobs[i][0] for i in range(len(jobs)) if futures[i].exception() is not None]
+
+        if len(failed) > 0:
+            Journal.log(self.__class__.__name__,
+                "_generate_all_descriptions",
+                "Failed to generate " + ", ".join(failed) + "!!!",
+                LogType.EXCEP,
+                throw_when_excep = True)
         
     def _import_urdf(self, 
                 robot_name: str,
@@ -1034,8 +1065,7 @@ class IsaacTask(BaseTask):
         return success
     
     def _init_contact_sensors(self):
-        for i in range(0, len(self.robot_names)):
-            robot_name = self.robot_names[i]
+        for robot_name in self.robot_names:
             # creates base contact sensor (which is then cloned)
             self.omni_contact_sensors[robot_name].create_contact_sensors(
                                                     self._world, 
@@ -1044,58 +1074,88 @@ class IsaacTask(BaseTask):
                             
     def _init_robots_state(self):
 
-        for i in range(0, len(self.robot_names)):
+        # we first read the initial state of all robots
+        poses = []
+        jnts_q = []
+        root_v = []
+        root_omega = []
+        jnts_v = []
+        for robot_name in self.robot_names:
+            art_view = self._robots_art_views[robot_name]
+            # no need to clone here, since data is copied when stacking
+            poses.append(art_view.get_world_poses(clone = False)) # tuple: (pos, quat)
+            jnts_q.append(art_view.get_joint_positions(clone = False)) # joint positions 
+            root_v.append(art_view.get_linear_velocities(clone = False)) # root lin. velocity
+            root_omega.append(art_view.get_angular_velocities(clone = False)) # root ang. velocity
+            jnts_v.append(art_view.get_joint_velocities(clone = False)) # joint velocities
+
+        # measured states are stored in stacked (n_robots, num_envs, D) tensors, so that
+        # math over all robots can be performed at once; per-robot states are views
+        self._root_p_all = torch.stack([pose[0] for pose in poses], dim=0)
+        self._root_p_prev_all = self._root_p_all.clone()
+        self._root_q_all = torch.stack([pose[1] for pose in poses], dim=0)
+        self._root_q_prev_all = self._root_q_all.clone()
+        self._root_v_all = torch.stack(root_v, dim=0)
+        self._root_omega_all = torch.stack(root_omega, dim=0)
+        self._jnts_q_all = None
+        self._jnts_q_prev_all = None
+        self._jnts_v_all = None
+        if all(q.shape == jnts_q[0].shape for q in jnts_q):
+            self._jnts_q_all = torch.stack(jnts_q, dim=0)
+            self._jnts_q_prev_all = self._jnts_q_all.clone()
+            self._jnts_v_all = torch.stack(jnts_v, dim=0)
+        # otherwise robots have a different number of dofs -> joint states 
+        # are stored separately for each robot
+
+        n_robots = len(self.robot_names)
+        # offsets use the same device and dtype as the states they are computed from
+        self._root_pos_offsets_all = torch.zeros((n_robots, self.num_envs, 3), 
+                                **self._tkw)
+        self._root_q_offsets_all = torch.zeros((n_robots, self.num_envs, 4), 
+                                **self._tkw)
+        self._root_q_offsets_all[..., 0] = 1.0 # init to valid identity quaternion
 
-            robot_name = self.robot_names[i]
-            pose = self._robots_art_views[robot_name].get_world_poses( 
-                                clone = True) # tuple: (pos, quat)
+        for i, robot_name in enumerate(self.robot_names):
 
             # root p (measured, previous, default)
-            self._root_p[robot_name] = pose[0]  
-            self._root_p_prev[robot_name] = torch.clone(pose[0])
-            self._root_p_default[robot_name] = torch.clone(pose[0]) + self.distr_offset[robot_name]
+            self._root_p[robot_name] = self._root_p_all[i]  
+            self._root_p_prev[robot_name] = self._root_p_prev_all[i]
+            self._root_p_default[robot_name] = torch.clone(self._root_p_all[i]) + self.distr_offset[robot_name]
             # root q (measured, previous, default)
-            self._root_q[robot_name] = pose[1] # root orientation
-            self._root_q_prev[robot_name] = torch.clone(pose[1])
-            self._root_q_default[robot_name] = torch.clone(pose[1])
+            self._root_q[robot_name] = self._root_q_all[i] # root orientation
+            self._root_q_prev[robot_name] = self._root_q_prev_all[i]
+            self._root_q_default[robot_name] = torch.clone(self._root_q_all[i])
             # jnt q (measured, previous, default)
-            self._jnts_q[robot_name] = self._robots_art_views[robot_name].get_joint_positions(
-                                            clone = True) # joint positions 
-            self._jnts_q_prev[robot_name] = self._robots_art_views[robot_name].get_joint_positions(
-                                            clone = True) 
+            if self._jnts_q_all is not None:
+                self._jnts_q[robot_name] = self._jnts_q_all[i] # joint positions
+                self._jnts_q_prev[robot_name] = self._jnts_q_prev_all[i]
+            else:
+                self._jnts_q[robot_name] = jnts_q[i].clone()
+                self._jnts_q_prev[robot_name] = jnts_q[i].clone()
             self._jnts_q_default[robot_name] = self.homers[robot_name].get_homing(clone=True)
             # root v (measured, default)
-            self._root_v[robot_name] = self._robots_art_views[robot_name].get_linear_velocities(
-                                            clone = True) # root lin. velocity
-            self._root_v_default[robot_name] = torch.full((self._root_v[robot_name].shape[0], self._root_v[robot_name].shape[1]), 
-                                                        0.0, 
-                                                        dtype=self.torch_dtype, 
-                                                        device=self.torch_device)
+            self._root_v[robot_name] = self._root_v_all[i] # root lin. velocity
+            self._root_v_default[robot_name] = torch.zeros((self._root_v[robot_name].shape[0], self._root_v[robot_name].shape[1]), 
+                                                           **self._tkw)
             # root omega (measured, default)
-            self._root_omega[robot_name] = self._robots_art_views[robot_name].get_angular_velocities(
-                                            clone = True) # root ang. velocity
-            self._root_omega_default[robot_name] = torch.full((self._root_omega[robot_name].shape[0], self._root_omega[robot_name].shape[1]), 
-                                                        0.0, 
-                                                        dtype=self.torch_dtype, 
-                                                        device=self.torch_device)
+            self._root_omega[robot_name] = self._root_omega_all[i] # root ang. velocity
+            self._root_omega_default[robot_name] = torch.zeros((self._root_omega[robot_name].shape[0], self._root_omega[robot_name].shape[1]), 
+                                                               **self._tkw)
             # joints v (measured, default)
-            self._jnts_v[robot_name] = self._robots_art_views[robot_name].get_joint_velocities( 
-                                            clone = True) # joint velocities
-            self._jnts_v_default[robot_name] = torch.full((self._jnts_v[robot_name].shape[0], self._jnts_v[robot_name].shape[1]), 
-                                                        0.0, 
-                                                        dtype=self.torch_dtype, 
-                                                        device=self.torch_device)
-            self._jnts_eff_default[robot_name] = torch.full((self._jnts_v[robot_name].shape[0], self._jnts_v[robot_name].shape[1]), 
-                                                        0.0, 
-                                                        dtype=self.torch_dtype, 
-                                                        device=self.torch_device)
-            self._root_pos_offsets[robot_name] = torch.zeros((self.num_envs, 3), 
-                                device=self.torch_device) # reference position offses
-            
-            self._root_q_offsets[robot_name] = torch.zeros((self.num_envs, 4), 
-                                device=self.torch_device)
-            self._root_q_offsets[robot_name][:, 0] = 1.0 # init to valid identity quaternion
-            self.update_root_offsets(robot_name)
+            if self._jnts_v_all is not None:
+                self._jnts_v[robot_name] = self._jnts_v_all[i] # joint velocities
+            else:
+                self._jnts_v[robot_name] = jnts_v[i].clone()
+            self._jnts_v_default[robot_name] = torch.zeros((self._jnts_v[robot_name].shape[0], self._jnts_v[robot_name].shape[1]), 
+                                                           **self._tkw)
+            self._jnts_eff_default[robot_name] = torch.zeros((self._jnts_v[robot_name].shape[0], self._jnts_v[robot_name].shape[1]), 
+                                                             **self._tkw)
+            self._root_pos_offsets[robot_name] = self._root_pos_offsets_all[i] # reference position offses
+            self._root_q_offsets[robot_name] = self._root_q_offsets_all[i]
+
+        # offsets of all robots are initialized at once (only planar position used)
+        self._root_pos_offsets_all[..., 0:2] = self._root_p_all[..., 0:2]
+        self._root_q_offsets_all[...] = self._root_q_all
             
     def _calc_robot_distrib(self):
 
@@ -1104,15 +1164,14 @@ class IsaacTask(BaseTask):
         # circumference of a circle of given radius
         n_robots = len(self.robot_names)
         offset_baseangle = 2 * math.pi / n_robots
-        for i in range(n_robots):
-            offset_angle = offset_baseangle * (i + 1) 
-            robot_offset_wrt_center = torch.tensor([self.spawning_radius * math.cos(offset_angle), 
-                                            self.spawning_radius * math.sin(offset_angle), 0], 
-                    device=self.torch_device, 
-                    dtype=self.torch_dtype)
-            # list with n references to the original tensor
-            tensor_list = [robot_offset_wrt_center] * self.num_envs
-            self.distr_offset[self.robot_names[i]] = torch.stack(tensor_list, dim=0)
+        # all offsets computed at once
+        offset_angles = offset_baseangle * torch.arange(1, n_robots + 1, **self._tkw)
+        robot_offsets_wrt_center = torch.stack((self.spawning_radius * torch.cos(offset_angles), 
+                                        self.spawning_radius * torch.sin(offset_angles), 
+                                        torch.zeros_like(offset_angles)), dim=-1)
+        for robot_name, robot_offset in zip(self.robot_names, robot_offsets_wrt_center):
+            # broadcasted view over all envs (no data is copied)
+            self.distr_offset[robot_name] = robot_offset.unsqueeze(0).expand(self.num_envs, 3)
 
     def _get_robots_state(self, 
                 env_indxs: torch.Tensor = None,
@@ -1121,90 +1180,102 @@ class IsaacTask(BaseTask):
                 reset: bool = False):
         
         rob_names = robot_names if (robot_names is not None) else self.robot_names
-        if env_indxs is not None:
-            for i in range(0, len(rob_names)):
-                robot_name = rob_names[i]
-                pose = self._robots_art_views[robot_name].get_world_poses( 
-                                                clone = True,
-                                                indices=env_indxs) # tuple: (pos, quat)
-                
-                self._root_p[robot_name][env_indxs, :] = pose[0] 
-                self._root_q[robot_name][env_indxs, :] = pose[1] # root orientation
-                self._jnts_q[robot_name][env_indxs, :] = self._robots_art_views[robot_name].get_joint_positions(
-                                                clone = True,
-                                                indices=env_indxs) # joint positions 
+        # selects all envs if no indexes are provided
+        selector = env_indxs if (env_indxs is not None) else slice(None)
+
+        with torch.no_grad():
+            # we first issue all the reads from the simulator, so that 
+            # the copies and num. differentiation below can be queued back-to-back.
+            # Readings are not cloned, since they are copied into the state 
+            # buffers right away (before the sim is stepped again)
+            readings = {}
+            for robot_name in rob_names:
+                art_view = self._robots_art_views[robot_name]
+                pose = art_view.get_world_poses(clone = False,
+                                    indices=env_indxs) # tuple: (pos, quat)
+                jnts_q = art_view.get_joint_positions(clone = False,
+                                    indices=env_indxs) # joint positions 
                 if dt is None:
                     # we get velocities from the simulation. This is not good since 
                     # these can actually represent artifacts which do not have physical meaning.
                     # It's better to obtain them by differentiation to avoid issues with controllers, etc...
-                    self._root_v[robot_name][env_indxs, :] = self._robots_art_views[robot_name].get_linear_velocities(
-                                                clone = True,
-                                                indices=env_indxs) # root lin. velocity               
-                    self._root_omega[robot_name][env_indxs, :] = self._robots_art_views[robot_name].get_angular_velocities(
-                                                clone = True,
-                                                indices=env_indxs) # root ang. velocity
-                    self._jnts_v[robot_name][env_indxs, :] = self._robots_art_views[robot_name].get_joint_velocities( 
-                                                clone = True,
-                                                indices=env_indxs) # joint velocities
+                    vels = (art_view.get_linear_velocities(clone = False,
+                                    indices=env_indxs), # root lin. velocity  
+                        art_view.get_angular_velocities(clone = False,
+                                    indices=env_indxs), # root ang. velocity
+                        art_view.get_joint_velocities(clone = False,
+                                    indices=env_indxs)) # joint velocities
                 else:
-                    # differentiate numerically
-                    if not reset:                    
-                        self._root_v[robot_name][env_indxs, :] = (self._root_p[robot_name][env_indxs, :] - \
-                                                        self._root_p_prev[robot_name][env_indxs, :]) / dt 
-                        self._root_omega[robot_name][env_indxs, :] = quat_to_omega(self._root_q[robot_name][env_indxs, :], 
-                                                                    self._root_q_prev[robot_name][env_indxs, :], 
-                                                                    dt)
-                        self._jnts_v[robot_name][env_indxs, :] = (self._jnts_q[robot_name][env_indxs, :] - \
-                                                        self._jnts_q_prev[robot_name][env_indxs, :]) / dt
-                    else:
-                        # to avoid issues when differentiating numerically
-                        self._root_v[robot_name][env_indxs, :].zero_()
-                        self._root_omega[robot_name][env_indxs, :].zero_()
-                        self._jnts_v[robot_name][env_indxs, :].zero_()
-                    # update "previous" data for numerical differentiation
-                    self._root_p_prev[robot_name][env_indxs, :] = self._root_p[robot_name][env_indxs, :] 
-                    self._root_q_prev[robot_name][env_indxs, :] = self._root_q[robot_name][env_indxs, :]
-                    self._jnts_q_prev[robot_name][env_indxs, :] = self._jnts_q[robot_name][env_indxs, :]
-        else:
-            # updating data for all environments
-            for i in range(0, len(rob_names)):
-                robot_name = rob_names[i]
-                pose = self._robots_art_views[robot_name].get_world_poses( 
-                                                clone = True) # tuple: (pos, quat)
-                self._root_p[robot_name][:, :] = pose[0]  
-                self._root_q[robot_name][:, :] = pose[1] # root orientation
-                self._jnts_q[robot_name][:, :] = self._robots_art_views[robot_name].get_joint_positions(
-                                                clone = True) # joint positions 
+                    vels = None
+                readings[robot_name] = (pose, jnts_q, vels)
+
+            # when updating all envs of all robots (with the same n. of dofs), the 
+            # numerical differentiation is performed at once on the stacked states
+            diff_all = dt is not None and env_indxs is None and \
+                self._jnts_q_all is not None and list(rob_names) == self.robot_names
+
+            for robot_name in rob_names:
+                pose, jnts_q, vels = readings[robot_name]
+                self._root_p[robot_name][selector, :] = pose[0] 
+                self._root_q[robot_name][selector, :] = pose[1] # root orientation
+                self._jnts_q[robot_name][selector, :] = jnts_q
                 if dt is None:
-                    # we get velocities from the simulation. This is not good since 
-                    # these can actually represent artifacts which do not have physical meaning.
-                    # It's better to obtain them by differentiation to avoid issues with controllers, etc...
-                    self._root_v[robot_name][:, :] = self._robots_art_views[robot_name].get_linear_velocities(
-                                                clone = True) # root lin. velocity 
-                    self._root_omega[robot_name][:, :] = self._robots_art_views[robot_name].get_angular_velocities(
-                                                    clone = True) # root ang. velocity
-                    self._jnts_v[robot_name][:, :] = self._robots_art_views[robot_name].get_joint_velocities( 
-                                                    clone = True) # joint velocities
-                else: 
+                    self._root_v[robot_name][selector, :] = vels[0]
+                    self._root_omega[robot_name][selector, :] = vels[1]
+                    self._jnts_v[robot_name][selector, :] = vels[2]
+                elif not diff_all:
                     # differentiate numerically
-                    if not reset:        
-                        self._root_v[robot_name][:, :] = (self._root_p[robot_name][:, :] - \
-                                                        self._root_p_prev[robot_name][:, :]) / dt 
-                        self._root_omega[robot_name][:, :] = quat_to_omega(self._root_q[robot_name][:, :], 
-                                                                    self._root_q_prev[robot_name][:, :], 
-                                                                    dt)
-                        self._jnts_v[robot_name][:, :] = (self._jnts_q[robot_name][:, :] - \
-                                                        self._jnts_q_prev[robot_name][:, :]) / dt
-                        # self._jnts_v[robot_name][:, :].zero_()
+                    if not reset:
+                        if env_indxs is None:
+                            # writing directly into the state buffers
+                            _diff_states(self._root_p[robot_name], self._root_p_prev[robot_name],
+                                    self._root_q[robot_name], self._root_q_prev[robot_name],
+                                    self._jnts_q[robot_name], self._jnts_q_prev[robot_name],
+                                    dt,
+                                    v_out=self._root_v[robot_name],
+                                    omega_out=self._root_omega[robot_name],
+                                    jv_out=self._jnts_v[robot_name])
+                        else:
+                            # advanced indexing returns copies, so we need to 
+                            # write back the results
+                            v, omega, jv = _diff_states(self._root_p[robot_name][env_indxs, :], self._root_p_prev[robot_name][env_indxs, :],
+                                    self._root_q[robot_name][env_indxs, :], self._root_q_prev[robot_name][env_indxs, :],
+                                    self._jnts_q[robot_name][env_indxs, :], self._jnts_q_prev[robot_name][env_indxs, :],
+                                    dt,
+                                    v_out=torch.empty_like(pose[0]),
+                                    omega_out=torch.empty_like(pose[0]),
+                                    jv_out=torch.empty_like(jnts_q))
+                            self._root_v[robot_name][env_indxs, :] = v
+                            self._root_omega[robot_name][env_indxs, :] = omega
+                            self._jnts_v[robot_name][env_indxs, :] = jv
                     else:
                         # to avoid issues when differentiating numerically
-                        self._root_v[robot_name][:, :].zero_()
-                        self._root_omega[robot_name][:, :].zero_()
-                        self._jnts_v[robot_name][:, :].zero_()
+                        self._root_v[robot_name][selector, :] = 0.0
+                        self._root_omega[robot_name][selector, :] = 0.0
+                        self._jnts_v[robot_name][selector, :] = 0.0
                     # update "previous" data for numerical differentiation
-                    self._root_p_prev[robot_name][:, :] = self._root_p[robot_name][:, :] 
-                    self._root_q_prev[robot_name][:, :] = self._root_q[robot_name][:, :]
-                    self._jnts_q_prev[robot_name][:, :] = self._jnts_q[robot_name][:, :]
+                    self._root_p_prev[robot_name][selector, :] = self._root_p[robot_name][selector, :] 
+                    self._root_q_prev[robot_name][selector, :] = self._root_q[robot_name][selector, :]
+                    self._jnts_q_prev[robot_name][selector, :] = self._jnts_q[robot_name][selector, :]
+
+            if diff_all:
+                if not reset:
+                    _diff_states(self._root_p_all, self._root_p_prev_all,
+                            self._root_q_all, self._root_q_prev_all,
+                            self._jnts_q_all, self._jnts_q_prev_all,
+                            dt,
+                            v_out=self._root_v_all,
+                            omega_out=self._root_omega_all,
+                            jv_out=self._jnts_v_all)
+                else:
+                    # to avoid issues when differentiating numerically
+                    self._root_v_all.zero_()
+                    self._root_omega_all.zero_()
+                    self._jnts_v_all.zero_()
+                # update "previous" data for numerical differentiation
+                self._root_p_prev_all.copy_(self._root_p_all) 
+                self._root_q_prev_all.copy_(self._root_q_all)
+                self._jnts_q_prev_all.copy_(self._jnts_q_all)
     
     def get_states(self,
                 env_indxs: torch.Tensor = None,
@@ -1219,7 +1290,15 @@ class IsaacTask(BaseTask):
             self._get_robots_state(env_indxs = env_indxs,
                             robot_names = robot_names) # velocities directly from simulator (can 
             # introduce relevant artifacts, making them unrealistic)
+        
+        self._update_contact_sensors()
 
+    def _update_contact_sensors(self):
+
+        # batched read of the contact forces of all contact links (over all envs)
+        for contact_sensors in self.omni_contact_sensors.values():
+            contact_sensors.update(dt = self.integration_dt())
+        
     def _custom_post_init(self):
         # can be overridden by child class
         pass
@@ -1230,14 +1309,11 @@ class IsaacTask(BaseTask):
         # manueally
         # we use the homing of the robots
         if (self._world_initialized):
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 homing = self.homers[robot_name].get_homing()
                 self._robots_art_views[robot_name].set_joints_default_state(positions= homing, 
-                                velocities = torch.zeros((homing.shape[0], homing.shape[1]), \
-                                                    dtype=self.torch_dtype, device=self.torch_device), 
-                                efforts = torch.zeros((homing.shape[0], homing.shape[1]), \
-                                                    dtype=self.torch_dtype, device=self.torch_device))
+                                velocities = self._homing_zero[robot_name], 
+                                efforts = self._homing_zero[robot_name])
         else:
             Journal.log(self.__class__.__name__,
                 "_set_robots_default_jnt_config",
@@ -1248,8 +1324,7 @@ class IsaacTask(BaseTask):
 
     def _set_robots_root_default_config(self):
         if (self._world_initialized):
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 self._robots_art_views[robot_name].set_default_state(positions = self._root_p_default[robot_name], 
                             orientations = self._root_q_default[robot_name])
         else:
@@ -1263,8 +1338,7 @@ class IsaacTask(BaseTask):
         return True
         
     def _get_solver_info(self):
-        for i in range(0, len(self.robot_names)):
-            robot_name = self.robot_names[i]
+        for robot_name in self.robot_names:
             self._solver_position_iteration_counts[robot_name] = self._robots_art_views[robot_name].get_solver_position_iteration_counts()
             self._solver_velocity_iteration_counts[robot_name] = self._robots_art_views[robot_name].get_solver_velocity_iteration_counts()
             self._solver_stabilization_threshs[robot_name] = self._robots_art_views[robot_name].get_stabilization_thresholds()
@@ -1272,12 +1346,8 @@ class IsaacTask(BaseTask):
     def _update_art_solver_options(self):
         
         # sets new solver iteration options for specifc articulations
-        self._get_solver_info() # gets current solver info for the articulations of the 
-        # environments, so that dictionaries are filled properly
-        
         if (self._world_initialized):
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 # increase by a factor
                 self._solver_position_iteration_counts[robot_name] = torch.full((self.num_envs,), self._solver_position_iteration_count)
                 self._solver_velocity_iteration_counts[robot_name] = torch.full((self.num_envs,), self._solver_velocity_iteration_count)
@@ -1285,8 +1355,8 @@ class IsaacTask(BaseTask):
                 self._robots_art_views[robot_name].set_solver_position_iteration_counts(self._solver_position_iteration_counts[robot_name])
                 self._robots_art_views[robot_name].set_solver_velocity_iteration_counts(self._solver_velocity_iteration_counts[robot_name])
                 self._robots_art_views[robot_name].set_stabilization_thresholds(self._solver_stabilization_threshs[robot_name])
-                self._get_solver_info() # gets again solver info for articulation, so that it's possible to debug if
-                # the operation was successful
+            self._get_solver_info() # gets again solver info for all articulations, so that it's possible to debug if
+            # the operation was successful
         else:
             Journal.log(self.__class__.__name__,
                 "_set_robots_default_jnt_config",
@@ -1297,15 +1367,16 @@ class IsaacTask(BaseTask):
     def _print_envs_info(self):
         if (self._world_initialized):
             print("TASK INFO:")
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
+                art_view = self._robots_art_views[robot_name]
+                # metadata is read from the info cached by _fill_robot_info_from_world()
                 task_info = f"[{robot_name}]" + "\n" + \
-                    "bodies: " + str(self._robots_art_views[robot_name].body_names) + "\n" + \
-                    "n. prims: " + str(self._robots_art_views[robot_name].count) + "\n" + \
-                    "prims names: " + str(self._robots_art_views[robot_name].prim_paths) + "\n" + \
-                    "n. bodies: " + str(self._robots_art_views[robot_name].num_bodies) + "\n" + \
-                    "n. dofs: " + str(self._robots_art_views[robot_name].num_dof) + "\n" + \
-                    "dof names: " + str(self._robots_art_views[robot_name].dof_names) + "\n" + \
+                    "bodies: " + str(self.robot_bodynames[robot_name]) + "\n" + \
+                    "n. prims: " + str(art_view.count) + "\n" + \
+                    "prims names: " + str(art_view.prim_paths) + "\n" + \
+                    "n. bodies: " + str(self.robot_n_links[robot_name]) + "\n" + \
+                    "n. dofs: " + str(self.robot_n_dofs[robot_name]) + "\n" + \
+                    "dof names: " + str(self.robot_dof_names[robot_name]) + "\n" + \
                     "solver_position_iteration_counts: " + str(self._solver_position_iteration_counts[robot_name]) + "\n" + \
                     "solver_velocity_iteration_counts: " + str(self._solver_velocity_iteration_counts[robot_name]) + "\n" + \
                     "stabiliz. thresholds: " + str(self._solver_stabilization_threshs[robot_name])
@@ -1330,12 +1401,14 @@ class IsaacTask(BaseTask):
     def _fill_robot_info_from_world(self):
 
         if self._world_initialized:
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
-                self.robot_bodynames[robot_name] = self._robots_art_views[robot_name].body_names
-                self.robot_n_links[robot_name] = self._robots_art_views[robot_name].num_bodies
-                self.robot_n_dofs[robot_name] = self._robots_art_views[robot_name].num_dof
-                self.robot_dof_names[robot_name] = self._robots_art_views[robot_name].dof_names
+            for robot_name in self.robot_names:
+                art_view = self._robots_art_views[robot_name]
+                # robot metadata does not change after the world is reset,
+                # so we read it from the view only once
+                self.robot_bodynames[robot_name] = art_view.body_names
+                self.robot_n_links[robot_name] = art_view.num_bodies
+                self.robot_n_dofs[robot_name] = art_view.num_dof
+                self.robot_dof_names[robot_name] = art_view.dof_names
         else:
             Journal.log(self.__class__.__name__,
                 "_fill_robot_info_from_world",
@@ -1346,12 +1419,12 @@ class IsaacTask(BaseTask):
     def _init_homing_managers(self):
         
         if self._world_initialized:
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 self.homers[robot_name] = OmniRobotHomer(articulation=self._robots_art_views[robot_name], 
                                     srdf_path=self._srdf_paths[robot_name], 
-                                    device=self.torch_device, 
-                                    dtype=self.torch_dtype)
+                                    **self._tkw)
+                # allocated once, since the homing shape does not change
+                self._homing_zero[robot_name] = torch.zeros_like(self.homers[robot_name].get_homing())
         else:
             exception = "you should reset the World at least once and call the " + \
                             "post_initialization_steps() method before initializing the " + \
@@ -1365,8 +1438,7 @@ class IsaacTask(BaseTask):
     def _init_jnt_imp_control(self):
     
         if self._world_initialized:
-            for i in range(0, len(self.robot_names)):
-                robot_name = self.robot_names[i]
+            for robot_name in self.robot_names:
                 # creates impedance controller
                 self.jnt_imp_controllers[robot_name] = OmniJntImpCntrl(articulation=self._robots_art_views[robot_name],
                                             default_pgain = self.default_jnt_stiffness, # defaults
@@ -1380,6 +1452,17 @@ class IsaacTask(BaseTask):
                                             enable_profiling=self._debug_enabled,
                                             urdf_path=self._urdf_paths[robot_name],
                                             debug_checks = self._debug_enabled)
+                # persistent buffers for gain updates
+                n_dofs = self.jnt_imp_controllers[robot_name].n_dofs
+                self._gains_pos_buf[robot_name] = torch.empty((self.num_envs, n_dofs), **self._tkw)
+                self._gains_vel_buf[robot_name] = torch.empty((self.num_envs, n_dofs), **self._tkw)
+                # joint names are fixed, so wheel joints are looked up only once
+                wheels_indxs = self.jnt_imp_controllers[robot_name].get_jnt_idxs_matching(
+                                name_pattern="wheel")
+                self._wheels_idxs[robot_name] = wheels_indxs
+                if wheels_indxs is not None:
+                    self._wheel_pos_buf[robot_name] = torch.empty((self.num_envs, len(wheels_indxs)), **self._tkw)
+                    self._wheel_vel_buf[robot_name] = torch.empty((self.num_envs, len(wheels_indxs)), **self._tkw)
                 self.reset_jnt_imp_control(robot_name)
                 
         else:
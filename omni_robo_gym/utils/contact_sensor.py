@@ -20,7 +20,7 @@ class OmniContactSensors:
             contact_offsets: Dict[str, Dict[str, np.ndarray]] = None,
             sensor_radii: Dict[str, Dict[str, np.ndarray]] = None,
             device = "cuda",
-            dtype = torch.float64,
+            dtype = torch.float32,
             enable_debug: bool = False,
             filter_paths: List[str] = ["/World/terrain/GroundPlane/CollisionPlane"]):
 
@@ -53,22 +53,13 @@ class OmniContactSensors:
 
         self.n_sensors = len(self.contact_prims)
 
-        self.in_contact = torch.full((n_envs, self.n_sensors), 
-                    False, 
-                    device = self.device, 
-                    dtype=torch.bool)
-        
-        self.force_norm = torch.full((n_envs, self.n_sensors), 
-                    -1.0, 
-                    device = self.device, 
-                    dtype=self.dtype)
-
-        self.n_contacts = torch.full((n_envs, self.n_sensors), 
-                    0, 
-                    device = self.device, 
-                    dtype=torch.int)
+        # contact data buffers are allocated lazily on the first update() call, 
+        # so that no device memory is used if contacts are never read
+        self.in_contact = None
+        self.force_norm = None
+        self._net_forces = None # net contact forces of all sensors, filled by update()
 
-        self.contact_sensors = [[None] * self.n_sensors] * n_envs # outer: environment, 
+        self.contact_sensors = [[None] * self.n_sensors for _ in range(n_envs)] # outer: environment, 
         # inner: contact sensor, ordered as in contact_prims
 
         self.contact_geom_prim_views = [None] * self.n_sensors
@@ -80,31 +71,20 @@ class OmniContactSensors:
                             contact_offsets: Dict[str, Dict[str, np.ndarray]],
                             sensor_radii: Dict[str, Dict[str, np.ndarray]]):
     
-        try:
-            self.contact_prims = contact_prims[name]
-        except:
-            Journal.log(self.__class__.__name__,
-                "_parse_contact_dicts",
-                f"Could not find key {name} in contact_prims dictionary.",
-                LogType.EXCEP,
-                throw_when_excep = True)                        
-        try:
-            self.contact_offsets = contact_offsets[name]
-        except:
-            Journal.log(self.__class__.__name__,
-                "_parse_contact_dicts",
-                f"Could not find key {name} in contact_offsets dictionary.",
-                LogType.EXCEP,
-                throw_when_excep = True)        
-        try:
-            self.sensor_radii = sensor_radii[name]
-        except:
-            Journal.log(self.__class__.__name__,
-                "_parse_contact_dicts",
-                f"Could not find key {name} in sensor_radii dictionary.",
-                LogType.EXCEP,
-                throw_when_excep = True)
+        for dict_name, contact_dict in (("contact_prims", contact_prims), 
+                                    ("contact_offsets", contact_offsets), 
+                                    ("sensor_radii", sensor_radii)):
+            if contact_dict is None or name not in contact_dict:
+                Journal.log(self.__class__.__name__,
+                    "_parse_contact_dicts",
+                    f"Could not find key {name} in {dict_name} dictionary.",
+                    LogType.EXCEP,
+                    throw_when_excep = True)
+        self.contact_prims = contact_prims[name]
+        self.contact_offsets = contact_offsets[name]
+        self.sensor_radii = sensor_radii[name]
                     
+        # offsets and radii are dicts keyed by link name (O(1) lookups)
         contact_offsets_ok = all(item in self.contact_offsets for item in self.contact_prims)
         sensor_radii_ok = all(item in self.sensor_radii for item in self.contact_prims)
 
@@ -139,12 +119,18 @@ class OmniContactSensors:
         robot_name = self.name
         contact_link_names = self.contact_prims
 
+        # prim path expressions and names of the contact link views are built at once
+        views_paths = [f"{envs_namespace}/env_.*/{robot_name}/{link_name}" for link_name in contact_link_names]
+        views_names = [f"{self.name}RigidPrimView{link_name}" for link_name in contact_link_names]
+
+        # we first create views of the contact links for all envs and 
+        # then register them to the scene in one go. A single view spans the
+        # same link over all (cloned) envs, so no per-env sensor creation is needed
+        new_views = []
         for sensor_idx in range(0, self.n_sensors): 
-            # we create views of the contact links for all envs
             if self.contact_geom_prim_views[sensor_idx] is None:                             
-                self.contact_geom_prim_views[sensor_idx] = RigidPrimView(prim_paths_expr=envs_namespace + "/env_.*/" + robot_name + \
-                                                            "/" + contact_link_names[sensor_idx],
-                                                    name= self.name + "RigidPrimView" + contact_link_names[sensor_idx], 
+                self.contact_geom_prim_views[sensor_idx] = RigidPrimView(prim_paths_expr=views_paths[sensor_idx],
+                                                    name=views_names[sensor_idx], 
                                                     contact_filter_prim_paths_expr= self._filter_paths,
                                                     prepare_contact_sensors=True, 
                                                     track_contact_forces = True,
@@ -152,38 +138,66 @@ class OmniContactSensors:
                                                     reset_xform_properties=False,
                                                     max_contact_count = self.n_envs
                                                     )
-                world.scene.add(self.contact_geom_prim_views[sensor_idx])   
+                new_views.append(self.contact_geom_prim_views[sensor_idx])
+        
+        for view in new_views:
+            world.scene.add(view)   
         
-        # for env_idx in range(0, self.n_envs):
-        # # env_idx = 0 # create contact sensors for base env only 
+        if len(new_views) > 0:
+            Journal.log(self.__class__.__name__,
+                "create_contact_sensors",
+                f"created {len(new_views)} contact link views for robot {robot_name} " + \
+                    f"over {self.n_envs} envs: [{' '.join(contact_link_names)}]",
+                LogType.STAT,
+                throw_when_excep = True)
 
-        #     for sensor_idx in range(0, self.n_sensors):
-                
-        #         contact_link_prim_path = envs_namespace + f"/env_{env_idx}" + \
-        #             "/" + robot_name + \
-        #                 "/" + contact_link_names[sensor_idx]
+    def _allocate_buffers(self):
 
-        #         sensor_prim_path = contact_link_prim_path + \
-        #                     "/contact_sensor" # contact sensor prim path
+        self.in_contact = torch.full((self.n_envs, self.n_sensors), 
+                    False, 
+                    device = self.device, 
+                    dtype=torch.bool)
+        
+        self.force_norm = torch.full((self.n_envs, self.n_sensors), 
+                    -1.0, 
+                    device = self.device, 
+                    dtype=self.dtype)
 
-        #         print(f"[{self.__class__.__name__}]" + f"[{self.journal.status}]" + ": creating contact sensor at " + 
-        #                     f"{sensor_prim_path}...")
+        self._net_forces = torch.zeros((self.n_envs, self.n_sensors, 3), 
+                    device = self.device, 
+                    dtype=self.dtype)
+        
+    def update(self, 
+        dt: float, 
+        force_thresh: float = 0.0):
 
-        #         contact_sensor = ContactSensor(
-        #                     prim_path=sensor_prim_path,
-        #                     name=f"{robot_name}{env_idx}_{contact_link_names[sensor_idx]}_contact_sensor",
-        #                     min_threshold=0,
-        #                     max_threshold=10000000,
-        #                     radius=self.sensor_radii[contact_link_names[sensor_idx]], 
-        #                     translation=self.contact_offsets[contact_link_names[sensor_idx]], 
-        #                     position=None
-        #                     )
+        # reads the net contact forces of all contact links into a single 
+        # (n_envs, n_sensors, 3) tensor and updates force norms and contact flags 
+        # with one batched pass
+        if self._net_forces is None:
+            self._allocate_buffers()
+        for sensor_idx in range(0, self.n_sensors):
+            self._net_forces[:, sensor_idx, :] = self.contact_geom_prim_views[sensor_idx].get_net_contact_forces(clone = False, 
+                                            dt = dt).view(self.n_envs, 3)
+        torch.linalg.vector_norm(self._net_forces, dim=-1, out=self.force_norm)
+        torch.gt(self.force_norm, force_thresh, out=self.in_contact)
 
-        #         self.contact_sensors[env_idx][sensor_idx] = world.scene.add(contact_sensor)
-        #         self.contact_sensors[env_idx][sensor_idx].add_raw_contact_data_to_frame()
+    def get_net_forces(self, 
+        env_indxs: torch.Tensor = None):
 
-        #         print(f"[{self.__class__.__name__}]" + f"[{self.journal.status}]" + ": contact sensor at " + 
-        #                     f"{sensor_prim_path} created.")
+        # forces read at the last update() call
+        if self._net_forces is None:
+            exception = f"No contact data available for robot {self.name}: update() was never called."
+            Journal.log(self.__class__.__name__,
+                "get_net_forces",
+                exception,
+                LogType.EXCEP,
+                throw_when_excep = True)
+            
+        if env_indxs is None:
+            return self._net_forces
+        else:
+            return self._net_forces[env_indxs, :, :]
 
     def get(self, 
         dt: float, 
@@ -195,8 +209,7 @@ class OmniContactSensors:
         try:
             index = self.contact_prims.index(contact_link)
         except:
-            exception = f"[{self.__class__.__name__}]" + f"[{self.journal.exception}]" + \
-                f"could not find contact link {contact_link} in contact list {' '.join(self.contact_prims)}." 
+            exception = f"could not find contact link {contact_link} in contact list {' '.join(self.contact_prims)}." 
             Journal.log(self.__class__.__name__,
                 "get",
                 exception,
@@ -19,11 +19,35 @@ from omni.isaac.core.articulations.articulation_view import ArticulationView
 
 import torch
 
+import os
+import functools
 import xml.etree.ElementTree as ET
 
 from SharsorIPCpp.PySharsorIPC import LogType
 from SharsorIPCpp.PySharsorIPC import Journal
 
+_HOME_JOINTS_PATH = ".//group_state[@name='home']/joint"
+
+@functools.lru_cache(maxsize=None)
+def _load_home_map(srdf_path: str, 
+                mtime: float):
+
+    # mtime is only used as part of the cache key, so that
+    # a regenerated srdf is parsed again
+    try:
+        srdf_root = ET.parse(srdf_path).getroot()
+    except ET.ParseError as e:
+        Journal.log("OmniRobotHomer",
+            "_load_home_map",
+            f"could not read SRDF at {srdf_path} properly!!",
+            LogType.WARN,
+            throw_when_excep = True)
+        return {}
+
+    # all the 'joint' elements within 'group_state' with the name attribute and their values
+    return {joint.attrib['name']: float(joint.attrib['value']) \
+        for joint in srdf_root.findall(_HOME_JOINTS_PATH)}
+
 class OmniRobotHomer:
 
     def __init__(self, 
@@ -31,7 +55,7 @@ class OmniRobotHomer:
             srdf_path: str, 
             backend = "torch", 
             device: torch.device = torch.device("cpu"), 
-            dtype = torch.float64):
+            dtype = torch.float32):
 
         self.torch_dtype = dtype 
         
@@ -54,14 +78,16 @@ class OmniRobotHomer:
         self.n_dofs = self._articulation.num_dof
         self.jnts_names = self._articulation.dof_names
 
-        self.joint_idx_map = {}
-        for joint in range(0, self.n_dofs):
-
-            self.joint_idx_map[self.jnts_names[joint]] = joint 
+        self.joint_idx_map = {jnt_name: i for i, jnt_name in enumerate(self.jnts_names)}
 
         if (backend != "torch"):
 
-            print(f"[{self.__class__.__name__}]"  + f"[{self.journal.info}]" + ": forcing torch backend. Other backends are not yet supported.")
+            warning = "Forcing torch backend. Other backends are not yet supported."
+            Journal.log(self.__class__.__name__,
+                "__init__",
+                warning,
+                LogType.WARN,
+                throw_when_excep = True)
         
         self._backend = "torch"
 
@@ -70,58 +96,47 @@ class OmniRobotHomer:
                         device = self._device, 
                         dtype=self.torch_dtype) # homing configuration
         
-        # open srdf and parse the homing field
-        
-        with open(srdf_path, 'r') as file:
-            
-            self._srdf_content = file.read()
-
-        try:
-            self._srdf_root = ET.fromstring(self._srdf_content)
-            # Now 'root' holds the root element of the XML tree.
-            # You can navigate through the XML tree to extract the tags and their values.
-            # Example: To find all elements with a specific tag, you can use:
-            # elements = root.findall('.//your_tag_name')
-
-            # Example: If you know the specific structure of your .SRDF file, you can extract
-            # the data accordingly, for instance:
-            # for child in root:
-            #     if child.tag == 'some_tag_name':
-            #         tag_value = child.text
-            #         # Do something with the tag value.
-            #     elif child.tag == 'another_tag_name':
-            #         # Handle another tag.
-
-        except ET.ParseError as e:
-        
-            print(f"[{self.__class__.__name__}]" + f"[{self.journal.warning}]" + ": could not read SRDF properly!!")
-
-        # Find all the 'joint' elements within 'group_state' with the name attribute and their values
-        joints = self._srdf_root.findall(".//group_state[@name='home']/joint")
-
-        self._homing_map = {}
-
-        for joint in joints:
-            joint_name = joint.attrib['name']
-            joint_value = joint.attrib['value']
-            self._homing_map[joint_name] =  float(joint_value)
+        # parse the homing field of the srdf (cached across homers sharing the same file)
+        self._homing_map = dict(_load_home_map(srdf_path, 
+                                    os.path.getmtime(srdf_path)))
         
         self._assign2homing()
 
     def _assign2homing(self):
         
+        # homing values are gathered on the host and written with a single indexed assignment
+        idxs = []
+        vals = []
+        missing = []
         for joint in list(self._homing_map.keys()):
             
             if joint in self.joint_idx_map:
                 
-                self._homing[:, self.joint_idx_map[joint]] = torch.full((self.num_robots, 1), 
-                                                                self._homing_map[joint],
-                                                                device = self._device, 
-                                                                dtype=self.torch_dtype).flatten()
+                idxs.append(self.joint_idx_map[joint])
+                vals.append(self._homing_map[joint])
+
             else:
 
-                print(f"[{self.__class__.__name__}]" + f"[{self.journal.warning}]" + f"[{self._assign2homing.__name__}]" \
-                      + ": joint " + f"{joint}" + " is not present in the articulation. It will be ignored.")
+                missing.append(joint)
+        
+        if len(missing) > 0:
+            # a single message for all missing joints
+            warning = f"Joints {', '.join(missing)} are not present in the articulation. They will be ignored."
+            Journal.log(self.__class__.__name__,
+                "_assign2homing",
+                warning,
+                LogType.WARN,
+                throw_when_excep = True)
+            
+        if len(idxs) > 0:
+
+            idxs = torch.tensor(idxs, dtype=torch.int64)
+            vals = torch.tensor(vals, dtype=self.torch_dtype)
+            if torch.device(self._device).type == "cuda":
+                # staged into pinned memory, so that the transfer to the device is async
+                idxs = idxs.pin_memory().to(self._device, non_blocking=True)
+                vals = vals.pin_memory().to(self._device, non_blocking=True)
+            self._homing[:, idxs] = vals
                 
     def get_homing(self, 
                 clone: bool = False):
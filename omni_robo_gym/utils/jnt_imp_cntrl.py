@@ -17,10 +17,11 @@
 # 
 import torch 
 
-from typing import List
+from typing import List, Dict
 from enum import Enum
 
 from omni.isaac.core.articulations.articulation_view import ArticulationView
+from omni.isaac.core.utils.types import ArticulationActions
 
 from omni_robo_gym.utils.urdf_helpers import UrdfLimitsParser
 
@@ -29,6 +30,78 @@ import time
 from SharsorIPCpp.PySharsorIPC import LogType
 from SharsorIPCpp.PySharsorIPC import Journal
 
+def _first_order_step(yk: torch.Tensor, 
+                ykm1: torch.Tensor, 
+                refk: torch.Tensor, 
+                refkm1: torch.Tensor, 
+                weight: float):
+    
+    # yk = coeff_ref * (refk + refkm1) + coeff_km1 * ykm1. Since 2 * coeff_ref + coeff_km1 = 1,
+    # this is yk = lerp(ykm1, (refk + refkm1) / 2, 2 * coeff_ref), i.e. two native lerp 
+    # kernels computed entirely in yk (no intermediate tensors)
+    torch.lerp(refkm1, refk, 0.5, out=yk)
+    torch.lerp(ykm1, yk, weight, out=yk)
+
+    return yk
+
+def _impedance_step(eff_ref: torch.Tensor, 
+                pv_refs: torch.Tensor, 
+                pv_state: torch.Tensor, 
+                pos_gains: torch.Tensor, 
+                vel_gains: torch.Tensor,
+                pv_errs: torch.Tensor, 
+                pos_err: torch.Tensor, 
+                vel_err: torch.Tensor, 
+                imp_eff: torch.Tensor):
+    
+    # imp_eff = eff_ref + pos_gains * (pos_ref - pos) + vel_gains * (vel_ref - vel).
+    # pv_* are (2 x num_robots x n_dofs) stacks of the pos and vel components, so both 
+    # errors are computed by a single kernel; pos_err and vel_err are the two views of pv_errs.
+    # All results are written into the provided (preallocated) buffers
+    torch.sub(pv_refs, pv_state, out=pv_errs)
+    torch.addcmul(eff_ref, pos_gains, pos_err, out=imp_eff)
+    imp_eff.addcmul_(vel_gains, vel_err)
+
+    return imp_eff
+
+def _impedance_law(eff_ref: torch.Tensor, 
+                pv_refs: torch.Tensor, 
+                pv_state: torch.Tensor, 
+                pos_gains: torch.Tensor, 
+                vel_gains: torch.Tensor,
+                pv_errs: torch.Tensor, 
+                imp_eff: torch.Tensor):
+    
+    # version of the impedance law meant to be compiled: the writes into the 
+    # preallocated buffers are part of the compiled region, so they are fused 
+    # into the kernel output (no temporaries are returned)
+    errs = pv_refs - pv_state
+    pv_errs.copy_(errs)
+    imp_eff.copy_(eff_ref + pos_gains * errs[0] + vel_gains * errs[1])
+
+def _make_compiled_impedance_step():
+    
+    # same interface of _impedance_step, but with the law compiled (and fused) 
+    # by torch.compile
+    impedance_law = torch.compile(_impedance_law, dynamic=False)
+
+    def _compiled_impedance_step(eff_ref: torch.Tensor, 
+                pv_refs: torch.Tensor, 
+                pv_state: torch.Tensor, 
+                pos_gains: torch.Tensor, 
+                vel_gains: torch.Tensor,
+                pv_errs: torch.Tensor, 
+                pos_err: torch.Tensor, 
+                vel_err: torch.Tensor, 
+                imp_eff: torch.Tensor):
+        
+        impedance_law(eff_ref, pv_refs, pv_state, pos_gains, vel_gains, 
+                pv_errs, imp_eff)
+
+        return imp_eff
+    
+    return _compiled_impedance_step
+
 class FirstOrderFilter:
 
     # a class implementing a simple first order filter
@@ -39,7 +112,8 @@ class FirstOrderFilter:
             rows: int = 1, 
             cols: int = 1, 
             device: torch.device = torch.device("cpu"),
-            dtype = torch.double):
+            dtype = torch.float32,
+            channels: int = 1):
         
         self._torch_dtype = dtype
 
@@ -49,78 +123,74 @@ class FirstOrderFilter:
 
         self._rows = rows
         self._cols = cols
+        self._channels = channels # independent signals filtered together 
+
+        # with more than one channel, buffers are (channels x rows x cols)
+        self._shape = (self._rows, self._cols) if self._channels == 1 \
+            else (self._channels, self._rows, self._cols)
 
         self._filter_BW = filter_BW
 
         import math 
         self._gain = 2 * math.pi * self._filter_BW
 
-        self.yk = torch.zeros((self._rows, self._cols), device = self._torch_device, 
+        self.yk = torch.zeros(self._shape, device = self._torch_device, 
                                 dtype=self._torch_dtype)
-        self.ykm1 = torch.zeros((self._rows, self._cols), device = self._torch_device, 
+        # filter state, kept separate from the output (which callers 
+        # may modify in place, e.g. when saturating it)
+        self._ykm1 = torch.zeros(self._shape, device = self._torch_device, 
                                 dtype=self._torch_dtype)
         
-        self.refk = torch.zeros((self._rows, self._cols), device = self._torch_device, 
-                                dtype=self._torch_dtype)
-        self.refkm1 = torch.zeros((self._rows, self._cols), device = self._torch_device, 
+        # after each update the current ref is always equal to refkm1, so no separate 
+        # refk buffer is kept (saves one copy per update)
+        self.refkm1 = torch.zeros(self._shape, device = self._torch_device, 
                                 dtype=self._torch_dtype)
         
         self._kh2 = self._gain * self._dt / 2.0
         self._coeff_ref = self._kh2 * 1/ (1 + self._kh2)
         self._coeff_km1 = (1 - self._kh2) / (1 + self._kh2)
+        self._lerp_weight = 2 * self._coeff_ref # = 1 - coeff_km1
 
     def update(self, 
                refk: torch.Tensor = None):
         
-        if refk is not None:
+        self.update_into(refk, self.yk)
+    
+    def update_into(self, 
+            refk: torch.Tensor, 
+            out: torch.Tensor):
+        
+        # the filter step writes its output directly into the provided 
+        # (preallocated) buffer
+        if refk is None:
+            # holding the last ref
+            refk = self.refkm1
 
-            self.refk[:, :] = refk
+        _first_order_step(out, self._ykm1, 
+                    refk, self.refkm1, 
+                    self._lerp_weight)
 
-        self.yk[:, :] = torch.add(torch.mul(self.ykm1, self._coeff_km1), 
-                            torch.mul(torch.add(self.refk, self.refkm1), 
-                                        self._coeff_ref))
+        if refk is not self.refkm1:
+            self.refkm1.copy_(refk)
+        self._ykm1.copy_(out)
 
-        self.refkm1[:, :] = self.refk
-        self.ykm1[:, :] = self.yk
+        return out
     
     def reset(self,
             idxs: torch.Tensor = None):
 
-        if idxs is not None:
+        if idxs is None:
 
-            self.yk[:, :] = torch.zeros((self._rows, self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.ykm1[:, :] = torch.zeros((self._rows, self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.refk[:, :] = torch.zeros((self._rows, self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.refkm1[:, :] = torch.zeros((self._rows, self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
+            self.yk.zero_()
+            self._ykm1.zero_()
+            self.refkm1.zero_()
 
         else:
             
-            self.yk[idxs, :] = torch.zeros((idxs.shape[0], self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.ykm1[idxs, :] = torch.zeros((idxs.shape[0], self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.refk[idxs, :] = torch.zeros((idxs.shape[0], self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
-            
-            self.refkm1[idxs, :] = torch.zeros((idxs.shape[0], self._cols), 
-                                device = self._torch_device, 
-                                dtype=self._torch_dtype)
+            # rows are always the second to last dim (also with multiple channels)
+            self.yk[..., idxs, :] = 0
+            self._ykm1[..., idxs, :] = 0
+            self.refkm1[..., idxs, :] = 0
             
     def get(self):
 
@@ -135,48 +205,76 @@ class JntSafety:
 
         self.limit_matrix = self.limits_parser.get_limits_matrix()
 
+        # the limits columns are strided views of limit_matrix -> contiguous copies are 
+        # made once, instead of reading them with a strided access at each clamp
+        self._q_min, self._v_min, self._eff_min, \
+            self._q_max, self._v_max, self._eff_max = \
+            (self.limit_matrix[:, i].contiguous() for i in range(6))
+
     def apply(self, q_cmd=None, v_cmd=None, eff_cmd=None):
 
+        cmds = [cmd for cmd in (q_cmd, v_cmd, eff_cmd) if cmd is not None]
+
+        # all commands are checked for nans with a single reduction (i.e. only 
+        # one device-host sync), instead of one per command
+        if len(cmds) > 0 and self.has_nan(*cmds):
+            
+            self._log_nan()
+
+            for cmd in cmds:
+                # Replace NaN values with infinity, so that we can clamp it
+                torch.nan_to_num(cmd, nan=torch.inf, out=cmd)
+
         if q_cmd is not None:
-            self.saturate_tensor(q_cmd, position=True)
+            self.saturate_tensor(q_cmd, position=True, check_nan=False)
 
         if v_cmd is not None:
-            self.saturate_tensor(v_cmd, velocity=True)
+            self.saturate_tensor(v_cmd, velocity=True, check_nan=False)
 
         if eff_cmd is not None:
-            self.saturate_tensor(eff_cmd, effort=True)
+            self.saturate_tensor(eff_cmd, effort=True, check_nan=False)
 
     def has_nan(self, 
-            tensor):
+            *tensors):
 
-        return torch.any(torch.isnan(tensor))
+        nan_found = torch.any(torch.isnan(tensors[0]))
+        for i in range(1, len(tensors)):
+            # accumulated in place (no per-call list + stack)
+            nan_found.logical_or_(torch.any(torch.isnan(tensors[i])))
+        
+        return nan_found
 
-    def saturate_tensor(self, tensor, position=False, velocity=False, effort=False):
+    def _log_nan(self):
 
-        if self.has_nan(tensor):
+        exception = f"Found nan elements in provided tensor!!"
 
-            exception = f"Found nan elements in provided tensor!!"
+        Journal.log(self.__class__.__name__,
+            "saturate_tensor",
+            exception,
+            LogType.EXCEP,
+            throw_when_excep = False)
+        
+    def saturate_tensor(self, tensor, position=False, velocity=False, effort=False, 
+                check_nan=True):
 
-            Journal.log(self.__class__.__name__,
-                "saturate_tensor",
-                exception,
-                LogType.EXCEP,
-                throw_when_excep = False)
+        if check_nan and self.has_nan(tensor):
+
+            self._log_nan()
             
             # Replace NaN values with infinity, so that we can clamp it
-            tensor[:, :] = torch.nan_to_num(tensor, nan=torch.inf)
+            torch.nan_to_num(tensor, nan=torch.inf, out=tensor)
 
         if position:
             
-            tensor[:, :] = torch.clamp(tensor[:, :], min=self.limit_matrix[:, 0], max=self.limit_matrix[:, 3])
+            torch.clamp(tensor, min=self._q_min, max=self._q_max, out=tensor)
 
         elif velocity:
             
-            tensor[:, :] = torch.clamp(tensor[:, :], min=self.limit_matrix[:, 1], max=self.limit_matrix[:, 4])
+            torch.clamp(tensor, min=self._v_min, max=self._v_max, out=tensor)
                 
         elif effort:
             
-            tensor[:, :] = torch.clamp(tensor[:, :], min=self.limit_matrix[:, 2], max=self.limit_matrix[:, 5])               
+            torch.clamp(tensor, min=self._eff_min, max=self._eff_max, out=tensor)               
             
 class OmniJntImpCntrl:
 
@@ -186,6 +284,16 @@ class OmniJntImpCntrl:
         VALID = 1
         INVALID = 0
 
+    # layout of the backing buffer (see _allocate_buffers)
+    _N_BUFFERS = 11
+    _ZERO_INIT_SLICE = slice(2, 11) # refs, errors, state and imp. effort
+    _REFS_SLICE = slice(2, 5) # eff_ref, pos_ref, vel_ref
+    _STATE_SLICE = slice(7, 10) # pos, vel, eff
+    # pos and vel components are also adjacent within refs, errors and state 
+    _PV_REFS_SLICE = slice(3, 5)
+    _PV_ERRS_SLICE = slice(5, 7)
+    _PV_STATE_SLICE = slice(7, 9)
+
     def __init__(self, 
                 articulation: ArticulationView,
                 default_pgain = 300.0, 
@@ -196,17 +304,27 @@ class OmniJntImpCntrl:
                 filter_dt = None, # should correspond to the dt between samples
                 override_art_controller = False,
                 init_on_creation = False, 
-                dtype = torch.double,
+                dtype = torch.float32,
                 enable_safety = True,
                 urdf_path: str = None,
                 enable_profiling: bool = False,
-                debug_checks: bool = False): # [s]
+                debug_checks: bool = False,
+                debug_range_checks: bool = False,
+                use_cuda_graphs: bool = False,
+                impedance_dtype = None,
+                compile_impedance: bool = False,
+                sync_on_profiling: bool = False): # [s]
         
         self._torch_dtype = dtype
         self._torch_device = device
 
         self.enable_profiling = enable_profiling
+        # if True, the device is synchronized around profiled sections, so that timings 
+        # also account for the (otherwise asynchronous) device work
+        self._debug_sync = enable_profiling and sync_on_profiling and \
+            torch.device(device).type == "cuda"
         self._debug_checks = debug_checks
+        self._debug_range_checks = debug_range_checks # selectors range checks (cause device syncs)
         # debug data
         self.profiling_data = {}
         self.profiling_data["time_to_update_state"] = -1.0
@@ -224,11 +342,27 @@ class OmniJntImpCntrl:
         self.override_art_controller = override_art_controller # whether to override Isaac's internal joint
         # articulation PD controller or not
 
+        # methods depending on override_art_controller are bound once here, so that 
+        # they do not need to branch on it at each call
+        if not self.override_art_controller:
+            self._init_gains = self._init_gains_native
+            self._init_refs = self._init_refs_native
+            self._push_gains = self._push_gains_native
+            self._apply_cmds_filt = self._apply_cmds_filt_native
+            self._apply_cmds_raw = self._apply_cmds_raw_native
+        else:
+            self._init_gains = self._init_gains_override
+            self._init_refs = self._init_refs_override
+            self._push_gains = self._push_gains_override
+            self._apply_cmds_filt = self._apply_cmds_filt_override
+            self._apply_cmds_raw = self._apply_cmds_raw_override
+
         self.init_art_on_creation = init_on_creation # init. articulation's gains and refs as soon as the controller
         # is created
 
         self.gains_initialized = False
         self.refs_initialized = False
+        self._refs_dirty = True # whether refs changed since they were last sent to the articulation
 
         self._default_pgain = default_pgain
         self._default_vgain = default_vgain
@@ -254,6 +388,8 @@ class OmniJntImpCntrl:
         self.n_dofs = self._articulation_view.num_dof
         self.jnts_names = self._articulation_view.dof_names
 
+        self._idx_cache: Dict[str, torch.Tensor] = {} # name_pattern -> matching jnt idxs
+
         if (backend != "torch"):
             warning = f"Only supported backend is torch!!!"
             Journal.log(self.__class__.__name__,
@@ -263,6 +399,19 @@ class OmniJntImpCntrl:
                 throw_when_excep = True)
         self._backend = "torch"
 
+        # buffers are given to the articulation view as they are, so they should
+        # use its native dtype (otherwise each call would add a cast + temporary copy)
+        art_dtype = self._articulation_view.get_joint_positions(clone=False).dtype
+        if art_dtype != self._torch_dtype:
+            warning = f"Provided dtype {self._torch_dtype} does not match the articulation's one ({art_dtype}). " + \
+                f"Using {art_dtype} instead."
+            Journal.log(self.__class__.__name__,
+                "__init__",
+                warning,
+                LogType.WARN,
+                throw_when_excep = True)
+            self._torch_dtype = art_dtype
+
         if self.enable_safety:
             if self.urdf_path is None:
                 exception = "If enable_safety is set to True, a urdf_path should be provided too!"
@@ -277,35 +426,108 @@ class OmniJntImpCntrl:
                                         device=self._torch_device)
             self.limiter = JntSafety(urdf_parser=self.robot_limits)
             
+        # index tensors used when no selector is provided (created once)
+        self._all_dofs_idxs = torch.arange(self.n_dofs, 
+                                        dtype=torch.int64,
+                                        device=self._torch_device)
+        self._all_robots_idxs = torch.arange(self.num_robots, 
+                                        dtype=torch.int64,
+                                        device=self._torch_device)
+
+        # optionally, the explicit impedance law can be computed with a lower precision 
+        # dtype (e.g. torch.bfloat16): its operands (i.e. the whole backing) are then stored 
+        # with it, and only the resulting effort is cast to the articulation's dtype
+        self._buffers_dtype = self._torch_dtype
+        if impedance_dtype is not None and impedance_dtype != self._torch_dtype:
+            if self.override_art_controller:
+                self._buffers_dtype = impedance_dtype
+            else:
+                warning = "impedance_dtype is only used when overriding the articulation controller. " + \
+                    "It will be ignored."
+                Journal.log(self.__class__.__name__,
+                    "__init__",
+                    warning,
+                    LogType.WARN,
+                    throw_when_excep = True)
+
+        self._pos_gains = None
+        self._vel_gains = None
+        self._eff_ref = None
+        self._pos_ref = None
+        self._vel_ref = None
         self._pos_err = None
         self._vel_err = None
         self._pos = None
         self._vel = None
         self._eff = None
         self._imp_eff = None
+        self._backing = None
+        self._refs = None
+        self._pv_refs = None
+        self._pv_errs = None
+        self._pv_state = None
+        self._zero_gains = None
+        self._imp_eff_cmd = None
+        self._staging_backing = None
+        self._staging_views = None
+        self._staging_events = None
+        self._allocate_buffers() # allocated once, reset() only works in place
+
+        # buffers never move, so the impedance step can optionally be captured 
+        # and replayed as a CUDA graph (one graph per input source, lazily captured)
+        self._imp_step = _impedance_step
+        if compile_impedance:
+            if self.override_art_controller and hasattr(torch, "compile"):
+                self._imp_step = _make_compiled_impedance_step()
+            else:
+                warning = "The impedance law can only be compiled when overriding the articulation " + \
+                    "controller and with torch >= 2.0. It will not be compiled."
+                Journal.log(self.__class__.__name__,
+                    "__init__",
+                    warning,
+                    LogType.WARN,
+                    throw_when_excep = True)
+            if use_cuda_graphs:
+                warning = "CUDA graphs cannot be used together with a compiled impedance law. " + \
+                    "They will not be used."
+                Journal.log(self.__class__.__name__,
+                    "__init__",
+                    warning,
+                    LogType.WARN,
+                    throw_when_excep = True)
+                use_cuda_graphs = False
+
+        self._imp_graphs = None
+        if use_cuda_graphs:
+            if self.override_art_controller and \
+                torch.device(self._torch_device).type == "cuda":
+                self._imp_graphs = {}
+            else:
+                warning = "CUDA graphs can only be used with a cuda device and when " + \
+                    "overriding the articulation controller. They will not be used."
+                Journal.log(self.__class__.__name__,
+                    "__init__",
+                    warning,
+                    LogType.WARN,
+                    throw_when_excep = True)
 
         self._filter_available = False
         if filter_dt is not None:
             self._filter_BW = filter_BW
             self._filter_dt = filter_dt
-            self._pos_ref_filter = FirstOrderFilter(dt=self._filter_dt, 
+            # eff, pos and vel refs are filtered together (one channel each)
+            self._ref_filter = FirstOrderFilter(dt=self._filter_dt, 
                                     filter_BW=self._filter_BW, 
                                     rows=self.num_robots, 
                                     cols=self.n_dofs, 
                                     device=self._torch_device, 
-                                    dtype=self._torch_dtype)
-            self._vel_ref_filter = FirstOrderFilter(dt=self._filter_dt, 
-                                    filter_BW=self._filter_BW, 
-                                    rows=self.num_robots, 
-                                    cols=self.n_dofs, 
-                                    device=self._torch_device, 
-                                    dtype=self._torch_dtype)
-            self._eff_ref_filter = FirstOrderFilter(dt=self._filter_dt, 
-                                    filter_BW=self._filter_BW, 
-                                    rows=self.num_robots, 
-                                    cols=self.n_dofs, 
-                                    device=self._torch_device, 
-                                    dtype=self._torch_dtype)
+                                    dtype=self._buffers_dtype,
+                                    channels=3)
+            # the filter writes directly into this buffer (same ordering of _REFS_SLICE)
+            self._refs_filt = torch.zeros_like(self._refs)
+            self._eff_ref_filt, self._pos_ref_filt, self._vel_ref_filt = \
+                self._refs_filt.unbind(0)
+            self._pv_refs_filt = self._refs_filt[1:3] # stacked pos and vel filtered refs
             self._filter_available = True
 
         else:
@@ -317,6 +539,21 @@ class OmniJntImpCntrl:
                 LogType.WARN,
                 throw_when_excep = True)
                             
+        self._imp_args = self._gen_imp_args()
+
+        # actions sending pos/vel targets and efforts to the articulation in a single call 
+        # (they only reference the buffers, so they are built once)
+        self._ref_actions = ArticulationActions(joint_positions=self._pos_ref,
+                                        joint_velocities=self._vel_ref,
+                                        joint_efforts=self._eff_ref,
+                                        joint_indices=self._all_dofs_idxs)
+        self._ref_filt_actions = None
+        if self._filter_available:
+            self._ref_filt_actions = ArticulationActions(joint_positions=self._pos_ref_filt,
+                                        joint_velocities=self._vel_ref_filt,
+                                        joint_efforts=self._eff_ref_filt,
+                                        joint_indices=self._all_dofs_idxs)
+
         self.reset() # initialize data
 
     def update_state(self, 
@@ -327,31 +564,52 @@ class OmniJntImpCntrl:
         jnt_indxs: torch.Tensor = None):
 
         if self.enable_profiling:
+            self._sync()
             self.start_time = time.perf_counter()
                                       
         selector = self._gen_selector(robot_indxs=robot_indxs, 
                         jnt_indxs=jnt_indxs) # only checks and throws
         # if debug_checks
         
+        if selector is None and \
+            pos is not None and vel is not None and eff is not None and \
+            pos.device == vel.device == eff.device == self._backing.device:
+            
+            for signal, name in ((pos, "pos"), (vel, "vel"), (eff, "eff")):   
+                self._validate_signal(signal = signal, 
+                    selector = selector,
+                    name=name) # does nothing if not debug_checks
+            # pos, vel and eff are adjacent in the backing -> single stacked copy
+            torch.stack((pos, vel, eff), dim=0, 
+                    out=self._backing[self._STATE_SLICE])
+            
+            if self.enable_profiling:
+                self._sync()
+                self.profiling_data["time_to_update_state"] = \
+                    time.perf_counter() - self.start_time
+            
+            return
+        
         if pos is not None:
             self._validate_signal(signal = pos, 
                     selector = selector,
                     name="pos") # does nothing if not debug_checks
-            self._pos[selector] = pos
+            self._assign_signal(self._pos, pos, selector)
 
         if vel is not None:
             self._validate_signal(signal = vel, 
                     selector = selector,
                     name="vel") 
-            self._vel[selector] = vel
+            self._assign_signal(self._vel, vel, selector)
 
         if eff is not None:
             self._validate_signal(signal = eff, 
                     selector = selector,
                     name="eff") 
-            self._eff[selector] = eff
+            self._assign_signal(self._eff, eff, selector)
 
         if self.enable_profiling:
+            self._sync()
             self.profiling_data["time_to_update_state"] = \
                 time.perf_counter() - self.start_time
                 
@@ -369,18 +627,18 @@ class OmniJntImpCntrl:
             self._validate_signal(signal = pos_gains, 
                 selector = selector,
                 name="pos_gains") 
-            self._pos_gains[selector] = pos_gains
-            if not self.override_art_controller:                
-                self._articulation_view.set_gains(kps = self._pos_gains)
+            self._assign_signal(self._pos_gains, pos_gains, selector)
 
         if vel_gains is not None:
 
             self._validate_signal(signal = vel_gains, 
                 selector = selector,
                 name="vel_gains") 
-            self._vel_gains[selector] = vel_gains
-            if not self.override_art_controller:
-                self._articulation_view.set_gains(kds = self._vel_gains)
+            self._assign_signal(self._vel_gains, vel_gains, selector)
+        
+        if pos_gains is not None or vel_gains is not None:
+            self._push_gains(pos_gains is not None, 
+                        vel_gains is not None)
     
     def set_refs(self, 
             eff_ref: torch.Tensor = None, 
@@ -390,31 +648,53 @@ class OmniJntImpCntrl:
             jnt_indxs: torch.Tensor = None):
         
         if self.enable_profiling:
+            self._sync()
             self.start_time = time.perf_counter()
 
+        self._refs_dirty = True
+
         selector = self._gen_selector(robot_indxs=robot_indxs, 
                            jnt_indxs=jnt_indxs) # only checks and throws
         # if debug_checks
         
+        if selector is None and \
+            eff_ref is not None and pos_ref is not None and vel_ref is not None and \
+            eff_ref.device == pos_ref.device == vel_ref.device == self._backing.device:
+            
+            for signal, name in ((eff_ref, "eff_ref"), (pos_ref, "pos_ref"), (vel_ref, "vel_ref")):   
+                self._validate_signal(signal = signal, 
+                    selector = selector,
+                    name=name) # does nothing if not debug_checks
+            # refs are adjacent in the backing -> single stacked copy
+            torch.stack((eff_ref, pos_ref, vel_ref), dim=0, 
+                    out=self._refs)
+            
+            if self.enable_profiling:
+                self._sync()
+                self.profiling_data["time_to_set_refs"] = time.perf_counter() - self.start_time
+            
+            return
+        
         if eff_ref is not None:
             self._validate_signal(signal = eff_ref, 
                 selector = selector,
                 name="eff_ref") 
-            self._eff_ref[selector] = eff_ref
+            self._assign_signal(self._eff_ref, eff_ref, selector)
 
         if pos_ref is not None:
             self._validate_signal(signal = pos_ref, 
                 selector = selector,
                 name="pos_ref") 
-            self._pos_ref[selector] = pos_ref
+            self._assign_signal(self._pos_ref, pos_ref, selector)
             
         if vel_ref is not None:
             self._validate_signal(signal = vel_ref, 
                     selector = selector,
                     name="vel_ref") 
-            self._vel_ref[selector] = vel_ref
+            self._assign_signal(self._vel_ref, vel_ref, selector)
 
         if self.enable_profiling:
+            self._sync()
             self.profiling_data["time_to_set_refs"] = time.perf_counter() - self.start_time
                 
     def apply_cmds(self, 
@@ -423,92 +703,167 @@ class OmniJntImpCntrl:
         # initialize gains and refs if not done previously 
         
         if self.enable_profiling:
+            self._sync()
             self.start_time = time.perf_counter()
 
         if not self.gains_initialized:
             self._apply_init_gains_to_art()
         if not self.refs_initialized:
             self._apply_init_refs_to_art()
-                
-        if filter and self._filter_available:
-            
-            self._pos_ref_filter.update(self._pos_ref)
-            self._vel_ref_filter.update(self._vel_ref)
-            self._eff_ref_filter.update(self._eff_ref)
+        
+        # branch-free variants, selected at construction. Run without autograd 
+        # bookkeeping; buffers are allocated outside inference mode (and lazy
+        # init above runs outside of it too), so they are only written in-place here
+        with torch.inference_mode():
+            if filter and self._filter_available:
+                self._apply_cmds_filt()
+            else:
+                self._apply_cmds_raw()
+        
+        if self.enable_profiling:
+            self._sync()
+            self.profiling_data["time_to_apply_cmds"] = \
+                time.perf_counter() - self.start_time 
+    
+    def _apply_filtered_refs_safety(self):
 
-            # we first filter, then apply safety
-            eff_ref_filt = self._eff_ref_filter.get()
-            pos_ref_filt = self._pos_ref_filter.get()
-            vel_ref_filt = self._vel_ref_filter.get()
+        self._ref_filter.update_into(self._refs, self._refs_filt)
 
-            if self.limiter is not None:
-                # saturating ref cmds
-                self.limiter.apply(q_cmd=pos_ref_filt,
-                                v_cmd=vel_ref_filt,
-                                eff_cmd=eff_ref_filt)
-                
-            if not self.override_art_controller:
-                # using omniverse's articulation PD controller
-                self._articulation_view.set_joint_efforts(eff_ref_filt)
-                self._articulation_view.set_joint_position_targets(pos_ref_filt)
-                self._articulation_view.set_joint_velocity_targets(vel_ref_filt)
+        # we first filter, then apply safety
+        if self.limiter is not None:
+            # saturating ref cmds
+            self.limiter.apply(q_cmd=self._pos_ref_filt,
+                            v_cmd=self._vel_ref_filt,
+                            eff_cmd=self._eff_ref_filt)
+    
+    def _apply_cmds_filt_native(self):
+        
+        self._apply_filtered_refs_safety()
 
-            else:
-                # impedance torque computed explicitly
-                self._pos_err  = torch.sub(self._pos_ref_filter.get(), self._pos)
-                self._vel_err = torch.sub(self._vel_ref_filter.get(), self._vel)
-                self._imp_eff = torch.add(self._eff_ref_filter.get(), 
-                                        torch.add(
-                                            torch.mul(self._pos_gains, 
-                                                    self._pos_err),
-                                            torch.mul(self._vel_gains,
-                                                    self._vel_err)))
-
-                # torch.cuda.synchronize()
-                # we also make the resulting imp eff safe
-                if self.limiter is not None:
-                    self.limiter.apply(eff_cmd=eff_ref_filt)
-                    
-                # apply only effort (comprehensive of all imp. terms)
-                self._articulation_view.set_joint_efforts(self._imp_eff)
+        # using omniverse's articulation PD controller
+        self._articulation_view.apply_action(self._ref_filt_actions, 
+                                indices=self._all_robots_idxs)
 
-        else:
+        self._refs_dirty = True # articulation now holds the filtered refs
+    
+    def _apply_cmds_filt_override(self):
+
+        self._apply_filtered_refs_safety()
+        
+        # impedance torque computed explicitly
+        # written into the preallocated views (which must stay bound to the backing)
+        self._compute_imp_eff(filtered=True)
+
+        # we also make the resulting imp eff safe
+        if self.limiter is not None:
+            self.limiter.apply(eff_cmd=self._imp_eff_cmd)
             
+        # apply only effort (comprehensive of all imp. terms)
+        self._articulation_view.set_joint_efforts(self._imp_eff_cmd, 
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+
+    def _apply_cmds_raw_native(self):
+        
+        # using omniverse's articulation PD controller: its pos/vel targets persist, so
+        # they are only sent again if refs changed since the last call
+        if self._refs_dirty:
             # we first apply safety to reference joint cmds
             if self.limiter is not None:
                 self.limiter.apply(q_cmd=self._pos_ref,
                                 v_cmd=self._vel_ref,
                                 eff_cmd=self._eff_ref)
-                    
-            if not self.override_art_controller:
-                # using omniverse's articulation PD controller
-                self._articulation_view.set_joint_efforts(self._eff_ref)
-                self._articulation_view.set_joint_position_targets(self._pos_ref)
-                self._articulation_view.set_joint_velocity_targets(self._vel_ref)
+            
+            self._articulation_view.apply_action(self._ref_actions, 
+                                indices=self._all_robots_idxs)
+
+            self._refs_dirty = False
         
-            else:
-                # impedance torque computed explicitly
-                self._pos_err  = torch.sub(self._pos_ref, self._pos)
-                self._vel_err = torch.sub(self._vel_ref, self._vel)
-                self._imp_eff = torch.add(self._eff_ref, 
-                                        torch.add(
-                                            torch.mul(self._pos_gains, 
-                                                    self._pos_err),
-                                            torch.mul(self._vel_gains,
-                                                    self._vel_err)))
+        else:
+            # actuation efforts have to be applied at each physics step (already 
+            # saturated when the refs were last sent)
+            self._articulation_view.set_joint_efforts(self._eff_ref, 
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+    
+    def _apply_cmds_raw_override(self):
+        
+        # we first apply safety to reference joint cmds
+        if self.limiter is not None:
+            self.limiter.apply(q_cmd=self._pos_ref,
+                            v_cmd=self._vel_ref,
+                            eff_cmd=self._eff_ref)
+            
+        # impedance torque computed explicitly
+        # written into the preallocated views (which must stay bound to the backing)
+        self._compute_imp_eff(filtered=False)
+
+        # we also make the resulting imp eff safe
+        if self.limiter is not None:
+            self.limiter.apply(eff_cmd=self._imp_eff_cmd)
+
+        # apply only effort (comprehensive of all imp. terms)
+        self._articulation_view.set_joint_efforts(self._imp_eff_cmd, 
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+    
+    def _gen_imp_args(self):
+        
+        # arguments of _impedance_step, depending on the refs source (raw/filtered)
+        imp_args = {False: (self._eff_ref, self._pv_refs, self._pv_state, 
+                        self._pos_gains, self._vel_gains, 
+                        self._pv_errs, self._pos_err, self._vel_err, 
+                        self._imp_eff)}
+        if self._filter_available:
+            imp_args[True] = (self._eff_ref_filt, self._pv_refs_filt) + imp_args[False][2:]
+        
+        return imp_args
+    
+    def _run_imp_step(self, 
+                    filtered: bool):
+        
+        self._imp_step(*self._imp_args[filtered])
 
-                # torch.cuda.synchronize()
+        if self._imp_eff_cmd is not self._imp_eff:
+            # only the output is cast to the articulation's dtype
+            self._imp_eff_cmd.copy_(self._imp_eff)
 
-                # we also make the resulting imp eff safe
-                if self.limiter is not None:
-                    self.limiter.apply(eff_cmd=self._imp_eff)
+    def _compute_imp_eff(self, 
+                    filtered: bool):
+        
+        if self._imp_graphs is None:
+            self._run_imp_step(filtered)
+            return
+        
+        graph = self._imp_graphs.get(filtered)
+        if graph is None:
+            graph = self._capture_imp_graph(filtered)
+            self._imp_graphs[filtered] = graph
+        
+        graph.replay()
 
-                # apply only effort (comprehensive of all imp. terms)
-                self._articulation_view.set_joint_efforts(self._imp_eff)
+    def _capture_imp_graph(self, 
+                    filtered: bool):
         
-        if self.enable_profiling:
-            self.profiling_data["time_to_apply_cmds"] = \
-                time.perf_counter() - self.start_time 
+        # warmup on a side stream, as required before capturing
+        current_stream = torch.cuda.current_stream(self._torch_device)
+        side_stream = torch.cuda.Stream(device=self._torch_device)
+        side_stream.wait_stream(current_stream)
+        with torch.cuda.stream(side_stream):
+            for _ in range(3):
+                self._run_imp_step(filtered)
+        current_stream.wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            self._run_imp_step(filtered)
+        
+        return graph
+    
+    def _sync(self):
+        
+        if self._debug_sync:
+            torch.cuda.synchronize(self._torch_device)
     
     def get_jnt_names_matching(self, 
                         name_pattern: str):
@@ -518,14 +873,22 @@ class OmniJntImpCntrl:
     def get_jnt_idxs_matching(self, 
                         name_pattern: str):
 
-        jnts_names = self.get_jnt_names_matching(name_pattern)
-        jnt_idxs = [self.jnts_names.index(jnt) for jnt in jnts_names]
+        if name_pattern in self._idx_cache:
+            
+            return self._idx_cache[name_pattern]
+        
+        # single pass over the joints (no per-match list.index lookups)
+        jnt_idxs = [i for i, jnt in enumerate(self.jnts_names) if name_pattern in jnt]
         if not len(jnt_idxs) == 0:
-            return torch.tensor(jnt_idxs, 
+            jnt_idxs = torch.tensor(jnt_idxs, 
                             dtype=torch.int64,
                             device=self._torch_device)
         else:
-            return None
+            jnt_idxs = None
+        
+        self._idx_cache[name_pattern] = jnt_idxs # joint names are fixed after init
+
+        return jnt_idxs
     
     def pos_gains(self):
 
@@ -537,16 +900,28 @@ class OmniJntImpCntrl:
     
     def eff_ref(self):
 
+        self._refs_dirty = True # the buffer may be modified by the caller
+
         return self._eff_ref
     
     def pos_ref(self):
 
+        self._refs_dirty = True # the buffer may be modified by the caller
+
         return self._pos_ref
 
     def vel_ref(self):
 
+        self._refs_dirty = True # the buffer may be modified by the caller
+
         return self._vel_ref
 
+    def invalidate_refs(self):
+
+        # to be called whenever the articulation's PD targets may have been overwritten 
+        # externally (e.g. by set_joint_positions on resets), so that refs are sent again
+        self._refs_dirty = True
+
     def pos_err(self):
 
         return self._pos_err
@@ -569,102 +944,38 @@ class OmniJntImpCntrl:
 
     def imp_eff(self):
 
-        return self._imp_eff
+        return self._imp_eff_cmd # what is actually sent to the articulation
     
     def reset(self,
             robot_indxs: torch.Tensor = None):
         
         self.gains_initialized = False
         self.refs_initialized = False
-        
-        self._all_dofs_idxs = torch.tensor([i for i in range(0, self.n_dofs)], 
-                                        dtype=torch.int64,
-                                        device=self._torch_device)
-        self._all_robots_idxs = torch.tensor([i for i in range(0, self.num_robots)], 
-                                        dtype=torch.int64,
-                                        device=self._torch_device)
+        self._refs_dirty = True
         
         if robot_indxs is None: # reset all data
 
-            # we assume diagonal joint impedance gain matrices, so we can save on memory and only store the diagonal
-            
-            self._pos_gains =  torch.full((self.num_robots, self.n_dofs), 
-                                        self._default_pgain, 
-                                        device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel_gains = torch.full((self.num_robots, self.n_dofs), 
-                                        self._default_vgain,
-                                        device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._eff_ref = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._pos_ref = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel_ref = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)                
-            self._pos_err = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel_err = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._pos = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._eff = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._imp_eff = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
+            self._pos_gains.fill_(self._default_pgain)
+            self._vel_gains.fill_(self._default_vgain)
+            self._backing[self._ZERO_INIT_SLICE].zero_()
             
             if self._filter_available:
-                self._pos_ref_filter.reset()
-                self._vel_ref_filter.reset()
-                self._eff_ref_filter.reset()
+                self._ref_filter.reset()
+                self._refs_filt.zero_()
         
         else: # only reset some robots
             
             if self._debug_checks:
                 self._validate_selectors(robot_indxs=robot_indxs) # throws if checks not satisfied
-
-            n_envs = robot_indxs.shape[0]
-
-            # we assume diagonal joint impedance gain matrices, so we can save on memory and only store the diagonal
             
-            self._pos_gains[robot_indxs, :] =  torch.full((n_envs, self.n_dofs), 
-                                        self._default_pgain, 
-                                        device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel_gains[robot_indxs, :] = torch.full((n_envs, self.n_dofs), 
-                                        self._default_vgain,
-                                        device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            
-            self._eff_ref[robot_indxs, :] = 0
-            self._pos_ref[robot_indxs, :] = 0
-            self._vel_ref[robot_indxs, :] = 0
-                
-            # if self.override_art_controller:
-                
-            # saving memory (these are not necessary if not overriding Isaac's art. controller)
-                                        
-            self._pos_err[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel_err[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
+            self._pos_gains[robot_indxs, :] = self._default_pgain
+            self._vel_gains[robot_indxs, :] = self._default_vgain
             
-            self._pos[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._vel[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            self._eff[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
-            
-            self._imp_eff[robot_indxs, :] = torch.zeros((n_envs, self.n_dofs), device = self._torch_device, 
-                                        dtype=self._torch_dtype)
+            self._backing[self._ZERO_INIT_SLICE, robot_indxs, :] = 0
 
             if self._filter_available:
-                self._pos_ref_filter.reset(idxs = robot_indxs)
-                self._vel_ref_filter.reset(idxs = robot_indxs)
-                self._eff_ref_filter.reset(idxs = robot_indxs)
+                self._ref_filter.reset(idxs = robot_indxs)
+                self._refs_filt[:, robot_indxs, :] = 0
 
         if self.init_art_on_creation:
             
@@ -672,22 +983,57 @@ class OmniJntImpCntrl:
             self._apply_init_gains_to_art()
             self._apply_init_refs_to_art()
      
+    def _allocate_buffers(self):
+
+        # all (num_robots x n_dofs) data lives in a single backing tensor (one allocation, 
+        # adjacent memory); each field is a view of it
+        self._backing = torch.zeros((self._N_BUFFERS, self.num_robots, self.n_dofs), 
+                                    device = self._torch_device, 
+                                    dtype=self._buffers_dtype)
+        
+        # we assume diagonal joint impedance gain matrices, so we can save on memory and only store the diagonal
+        self._pos_gains, self._vel_gains, \
+            self._eff_ref, self._pos_ref, self._vel_ref, \
+            self._pos_err, self._vel_err, \
+            self._pos, self._vel, self._eff, \
+            self._imp_eff = self._backing.unbind(0)
+        self._refs = self._backing[self._REFS_SLICE] # eff, pos and vel refs, as a single (3 x num_robots x n_dofs) view
+        self._pv_refs = self._backing[self._PV_REFS_SLICE]
+        self._pv_errs = self._backing[self._PV_ERRS_SLICE]
+        self._pv_state = self._backing[self._PV_STATE_SLICE]
+        
+        self._pos_gains.fill_(self._default_pgain)
+        self._vel_gains.fill_(self._default_vgain)
+        
+        if torch.device(self._torch_device).type == "cuda":
+            # pinned host mirror of the backing, used to stage signals coming from the cpu
+            self._staging_backing = torch.empty(self._backing.shape, 
+                                    dtype=self._buffers_dtype, 
+                                    pin_memory=True)
+            self._staging_views = dict(zip((view.data_ptr() for view in self._backing.unbind(0)), 
+                                    self._staging_backing.unbind(0)))
+            # one event per staging view, so that only transfers out of the view 
+            # about to be overwritten are waited for
+            self._staging_events = {ptr: torch.cuda.Event() for ptr in self._staging_views}
+        
+        if self.override_art_controller:
+            # used to disable Isaac's PD controller (never written to, unlike 
+            # the refs, which can change before the gains are applied)
+            self._zero_gains = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
+                                    dtype=self._torch_dtype)
+        
+        # effort actually sent to the articulation (only a separate buffer 
+        # if the impedance law uses a different dtype)
+        self._imp_eff_cmd = self._imp_eff
+        if self._buffers_dtype != self._torch_dtype:
+            self._imp_eff_cmd = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
+                                    dtype=self._torch_dtype)
+        
     def _apply_init_gains_to_art(self):
         
         if not self.gains_initialized:
             
-            if not self.override_art_controller:
-
-                self._articulation_view.set_gains(kps = self._pos_gains, 
-                                        kds = self._vel_gains)
-
-            else:
-                
-                # settings Isaac's PD controller gains to 0
-                no_gains = torch.zeros((self.num_robots, self.n_dofs), device = self._torch_device, 
-                                    dtype=self._torch_dtype)        
-                self._articulation_view.set_gains(kps = no_gains, 
-                                    kds = no_gains)
+            self._init_gains()
             
             self.gains_initialized = True
 
@@ -695,65 +1041,99 @@ class OmniJntImpCntrl:
 
         if not self.refs_initialized: 
             
-            if not self.override_art_controller:
-        
-                self._articulation_view.set_joint_efforts(self._eff_ref)
-                self._articulation_view.set_joint_position_targets(self._pos_ref)
-                self._articulation_view.set_joint_velocity_targets(self._vel_ref)
-
-            else:
-                
-                self._articulation_view.set_joint_efforts(self._eff_ref)
+            self._init_refs()
     
             self.refs_initialized = True
     
-    def _validate_selectors(self, 
-                robot_indxs: torch.Tensor = None, 
-                jnt_indxs: torch.Tensor = None):
+    def _init_gains_native(self):
 
-        if robot_indxs is not None:
+        self._articulation_view.set_gains(kps = self._pos_gains, 
+                                kds = self._vel_gains,
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+    
+    def _init_gains_override(self):
 
-            robot_indxs_shape = robot_indxs.shape
+        # settings Isaac's PD controller gains to 0
+        self._articulation_view.set_gains(kps = self._zero_gains, 
+                            kds = self._zero_gains,
+                            indices=self._all_robots_idxs, 
+                            joint_indices=self._all_dofs_idxs)
+    
+    def _init_refs_native(self):
 
-            if (not (len(robot_indxs_shape) == 1 and \
-                robot_indxs.dtype == torch.int64 and \
-                bool(torch.min(robot_indxs) >= 0) and \
-                bool(torch.max(robot_indxs) < self.num_robots)) and \
-                robot_indxs.device.type == self._torch_device.type): # sanity checks 
-                
-                error = "Mismatch in provided selector \n" + \
-                    "robot_indxs_shape -> " + f"{len(robot_indxs_shape)}" + " VS" + " expected -> " + f"{1}" + "\n" + \
-                    "robot_indxs.dtype -> " + f"{robot_indxs.dtype}" + " VS" + " expected -> " + f"{torch.int64}" + "\n" + \
-                    "torch.min(robot_indxs) >= 0) -> " + f"{bool(torch.min(robot_indxs) >= 0)}" + " VS" + f" {True}" + "\n" + \
-                    "torch.max(robot_indxs) < self.n_dofs -> " + f"{torch.max(robot_indxs)}" + " VS" + f" {self.num_robots}\n" + \
-                    "robot_indxs.device -> " + f"{robot_indxs.device.type}" + " VS" + " expected -> " + f"{self._torch_device.type}" + "\n"
-                Journal.log(self.__class__.__name__,
-                    "_validate_selectors",
-                    error,
-                    LogType.EXCEP,
-                    throw_when_excep = True)
+        self._articulation_view.apply_action(self._ref_actions, 
+                                indices=self._all_robots_idxs)
+    
+    def _init_refs_override(self):
 
-        if jnt_indxs is not None:
+        # the articulation always gets its own dtype (refs may be stored with impedance_dtype)
+        self._articulation_view.set_joint_efforts(self._eff_ref.to(self._torch_dtype), 
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+    
+    def _push_gains_native(self, 
+                    pos_gains_changed: bool, 
+                    vel_gains_changed: bool):
+        
+        # a single call to the articulation view for both gains
+        self._articulation_view.set_gains(kps = self._pos_gains if pos_gains_changed else None, 
+                                kds = self._vel_gains if vel_gains_changed else None,
+                                indices=self._all_robots_idxs, 
+                                joint_indices=self._all_dofs_idxs)
+    
+    def _push_gains_override(self, 
+                    pos_gains_changed: bool, 
+                    vel_gains_changed: bool):
+        
+        pass # Isaac's PD controller gains are kept to 0 
 
-            jnt_indxs_shape = jnt_indxs.shape
+    def _validate_selectors(self, 
+                robot_indxs: torch.Tensor = None, 
+                jnt_indxs: torch.Tensor = None):
 
-            if (not (len(jnt_indxs_shape) == 1 and \
-                jnt_indxs.dtype == torch.int64 and \
-                bool(torch.min(jnt_indxs) >= 0) and \
-                bool(torch.max(jnt_indxs) < self.n_dofs)) and \
-                jnt_indxs.device.type == self._torch_device.type): # sanity checks 
+        if robot_indxs is not None:
+            self._validate_indxs(indxs=robot_indxs, 
+                        upper=self.num_robots,
+                        name="robot_indxs")
 
-                error = "Mismatch in provided selector \n" + \
-                    "jnt_indxs_shape -> " + f"{len(jnt_indxs_shape)}" + " VS" + " expected -> " + f"{1}" + "\n" + \
-                    "jnt_indxs.dtype -> " + f"{jnt_indxs.dtype}" + " VS" + " expected -> " + f"{torch.int64}" + "\n" + \
-                    "torch.min(jnt_indxs) >= 0) -> " + f"{bool(torch.min(jnt_indxs) >= 0)}" + " VS" + f" {True}" + "\n" + \
-                    "torch.max(jnt_indxs) < self.n_dofs -> " + f"{torch.max(jnt_indxs)}" + " VS" + f" {self.num_robots}" + \
-                    "robot_indxs.device -> " + f"{jnt_indxs.device.type}" + " VS" + " expected -> " + f"{self._torch_device.type}" + "\n"
-                Journal.log(self.__class__.__name__,
-                    "_validate_selectors",
-                    error,
-                    LogType.EXCEP,
-                    throw_when_excep = True)
+        if jnt_indxs is not None:
+            self._validate_indxs(indxs=jnt_indxs, 
+                        upper=self.n_dofs,
+                        name="jnt_indxs")
+    
+    def _validate_indxs(self, 
+                indxs: torch.Tensor,
+                upper: int,
+                name: str):
+        
+        # cheap checks (metadata only, no device sync)
+        if not (indxs.dim() == 1 and \
+            indxs.dtype == torch.int64 and \
+            indxs.device.type == self._torch_device.type): # sanity checks 
+            
+            error = f"Mismatch in provided selector [{name}]\n" + \
+                f"{name} n. dims -> " + f"{indxs.dim()}" + " VS" + " expected -> " + f"{1}" + "\n" + \
+                f"{name} dtype -> " + f"{indxs.dtype}" + " VS" + " expected -> " + f"{torch.int64}" + "\n" + \
+                f"{name} device -> " + f"{indxs.device.type}" + " VS" + " expected -> " + f"{self._torch_device.type}" + "\n"
+            Journal.log(self.__class__.__name__,
+                "_validate_selectors",
+                error,
+                LogType.EXCEP,
+                throw_when_excep = True)
+        
+        # range checks need a device-host sync -> only done if explicitly required
+        if self._debug_range_checks and \
+            bool(torch.any(torch.logical_or(indxs < 0, indxs >= upper))):
+            
+            error = f"Out of range elements in provided selector [{name}]\n" + \
+                f"min. -> {torch.min(indxs)}, max. -> {torch.max(indxs)}" + \
+                f" VS expected range -> [0, {upper})\n"
+            Journal.log(self.__class__.__name__,
+                "_validate_selectors",
+                error,
+                LogType.EXCEP,
+                throw_when_excep = True)
     
     def _validate_signal(self, 
                     signal: torch.Tensor, 
@@ -763,17 +1143,18 @@ class OmniJntImpCntrl:
         if self._debug_checks:
 
             signal_shape = signal.shape
-            selector_shape = selector[0].shape
+            selector_shape = (selector[0].shape[0], selector[1].shape[1]) if selector is not None \
+                else (self.num_robots, self.n_dofs)
 
             if not (signal_shape[0] == selector_shape[0] and \
                 signal_shape[1] == selector_shape[1] and \
                 signal.device.type == self._torch_device.type and \
-                signal.dtype == self._torch_dtype):
+                signal.dtype.is_floating_point): # cast to the buffers dtype when assigned
 
                 big_error = f"Mismatch in provided signal [{name}" + "] and/or selector \n" + \
                     "signal rows -> " + f"{signal_shape[0]}" + " VS" + " expected rows -> " + f"{selector_shape[0]}" + "\n" + \
                     "signal cols -> " + f"{signal_shape[1]}" + " VS" + " expected cols -> " + f"{selector_shape[1]}" + "\n" + \
-                    "signal dtype -> " + f"{signal.dtype}" + " VS" + " expected -> " + f"{self._torch_dtype}" + "\n" + \
+                    "signal dtype -> " + f"{signal.dtype}" + " VS" + " expected -> floating point" + "\n" + \
                     "signal device -> " + f"{signal.device.type}" + " VS" + " expected type -> " + f"{self._torch_device.type}"
                 Journal.log(self.__class__.__name__,
                     "_validate_signal",
@@ -781,6 +1162,39 @@ class OmniJntImpCntrl:
                     LogType.EXCEP,
                     throw_when_excep = True)
     
+    def _assign_signal(self, 
+                    target: torch.Tensor,
+                    signal: torch.Tensor,
+                    selector = None):
+        
+        if selector is None:
+            # same shape -> plain copy, no advanced indexing (and no host 
+            # stall if the signal comes from another device)
+            if self._staging_views is not None and \
+                signal.device.type == "cpu" and not signal.is_pinned():
+                self._copy_staged(target, signal)
+            else:
+                target.copy_(signal, non_blocking=True)
+        else:
+            # index_put_ (unlike copy_) does not cast, e.g. if the caller uses a dtype 
+            # different from the articulation's one (which the buffers follow)
+            if signal.dtype != target.dtype:
+                signal = signal.to(target.dtype)
+            target.index_put_(selector, signal)
+
+    def _copy_staged(self, 
+                target: torch.Tensor,
+                signal: torch.Tensor):
+        
+        # pageable cpu signals are first copied into pinned memory, so that the 
+        # transfer to the device is actually asynchronous
+        staging = self._staging_views[target.data_ptr()]
+        staging_event = self._staging_events[target.data_ptr()]
+        staging_event.synchronize() # previous transfer out of this staging view is done
+        staging.copy_(signal)
+        target.copy_(staging, non_blocking=True)
+        staging_event.record()
+
     def _gen_selector(self, 
                 robot_indxs: torch.Tensor = None, 
                 jnt_indxs: torch.Tensor = None):
@@ -789,11 +1203,15 @@ class OmniJntImpCntrl:
             self._validate_selectors(robot_indxs=robot_indxs, 
                             jnt_indxs=jnt_indxs) # throws if not valid     
         
+        if robot_indxs is None and jnt_indxs is None:
+            return None # whole tensors are written
+        
         if robot_indxs is None:
             robot_indxs = self._all_robots_idxs
         if jnt_indxs is None:
             jnt_indxs = self._all_dofs_idxs
 
-        return torch.meshgrid((robot_indxs, jnt_indxs), 
-                            indexing="ij")
+        # (n_robots x 1) and (1 x n_jnts) index views, broadcast by indexing 
+        # itself -> no (n_robots x n_jnts) index grids are materialized
+        return (robot_indxs.unsqueeze(1), jnt_indxs.unsqueeze(0))
                     
\ No newline at end of file
@@ -1,5 +1,4 @@
 import torch
-import time
 import torch.nn.functional as F
 
 def normalize_quaternion(q):
@@ -39,17 +38,29 @@ def quaternion_to_angular_velocity(q_diff, dt):
     angle = angle.unsqueeze(-1)  # Add an extra dimension for broadcasting
     return (angle / dt) * axis
 
-def quat_to_omega(q0, q1, dt):
-    """ Convert quaternion pairs to angular velocities """
+def quat_to_omega(q0, q1, dt, out=None):
+    """ Convert quaternion pairs to angular velocities (optionally writing into out) """
     if q0.shape != q1.shape:
         raise ValueError("Tensor shapes do not match in quat_to_omega.")
 
-    # Normalize quaternions and compute differences
-    q0_normalized = normalize_quaternion(q0)
-    q1_normalized = normalize_quaternion(q1)
-    q_diff = quaternion_difference(q0_normalized, q1_normalized)
+    # Normalize quaternions
+    w0, x0, y0, z0 = normalize_quaternion(q0).unbind(-1)
+    w1, x1, y1, z1 = normalize_quaternion(q1).unbind(-1)
+
+    # quaternion difference q1 * conj(q0), expanded elementwise 
+    # so that no intermediate quaternion tensors are built
+    w = w1*w0 + x1*x0 + y1*y0 + z1*z0
+    axis = torch.stack([
+        - w1*x0 + x1*w0 - y1*z0 + z1*y0,
+        - w1*y0 + x1*z0 + y1*w0 - z1*x0,
+        - w1*z0 - x1*y0 + y1*x0 + z1*w0
+    ], dim=-1)
 
-    return quaternion_to_angular_velocity(q_diff, dt)
+    norm = axis.norm(dim=-1, keepdim=True)
+    norm = torch.where(norm > 0, norm, torch.ones_like(norm))
+    angle = 2 * torch.arccos(w.clamp(-1.0, 1.0)).unsqueeze(-1)  # Clamping for numerical stability
+
+    return torch.mul(axis, angle / (norm * dt), out=out)
 
 def rel_vel(offset_q0_q1, 
         v0):
@@ -73,20 +84,3 @@ def rel_vel(offset_q0_q1,
     v1 = v1_q[1:]
 
     return v1
-
-# Example usage
-n_envs = 100  # Number of environments
-dt = 0.1    # Time step
-
-# Random example tensors for initial and final orientations
-q_initial = torch.randn(n_envs, 4)
-q_final = torch.randn(n_envs, 4)
-
-start_time = time.perf_counter()
-# Convert to angular velocities
-omega = quat_to_omega(q_initial, q_final, dt)
-
-end_time = time.perf_counter()
-elapsed_time = end_time - start_time
-
-print(f"Time taken to compute angular velocities: {elapsed_time:.6f} seconds")
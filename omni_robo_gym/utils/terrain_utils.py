@@ -315,7 +315,7 @@ def convert_heightfield_to_trimesh(height_field_raw, horizontal_scale, vertical_
     vertices[:, 0] = xx.flatten()
     vertices[:, 1] = yy.flatten()
     vertices[:, 2] = hf.flatten() * vertical_scale
-    triangles = -np.ones((2*(num_rows-1)*(num_cols-1), 3), dtype=np.uint32)
+    triangles = np.full((2*(num_rows-1)*(num_cols-1), 3), np.iinfo(np.uint32).max, dtype=np.uint32)
     for i in range(num_rows - 1):
         ind0 = np.arange(0, num_cols-1) + i*num_cols
         ind1 = ind0 + 1
@@ -340,7 +340,7 @@ def add_terrain_to_stage(stage, vertices, triangles, position=None, orientation=
                         "Mesh")
     terrain_mesh.GetAttribute("points").Set(vertices)
     terrain_mesh.GetAttribute("faceVertexIndices").Set(triangles.flatten())
-    terrain_mesh.GetAttribute("faceVertexCounts").Set(np.asarray([3]*num_faces))
+    terrain_mesh.GetAttribute("faceVertexCounts").Set(np.full(num_faces, 3, dtype=np.int32))
 
     terrain = XFormPrim(prim_path="/World/terrain",
                         name="terrain",
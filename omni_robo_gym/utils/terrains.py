@@ -28,10 +28,48 @@ from pxr import Usd
 class RlTerrains():
 
     def __init__(self, 
-                stage: Usd.Stage):
+                stage: Usd.Stage, 
+                cache_dir: str = None):
         
         self._stage = stage
 
+        # if provided, generated terrain meshes are stored in (and loaded from) this 
+        # directory, keyed by terrain type and parameters. Note that random terrains 
+        # are then generated only once for a given set of parameters
+        self._cache_dir = cache_dir
+
+    def _get_trimesh(self, 
+                terrain_type: str, 
+                params: dict, 
+                generate):
+
+        if self._cache_dir is None:
+            return generate()
+        
+        import hashlib
+        key = hashlib.sha1((terrain_type + repr(sorted(params.items()))).encode()).hexdigest()[:16]
+        cache_path = os.path.join(self._cache_dir, f"terrain_{terrain_type}_{key}.npz")
+        
+        if os.path.isfile(cache_path):
+            with np.load(cache_path) as cached:
+                return cached["vertices"], cached["triangles"]
+
+        vertices, triangles = generate()
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # written to a temporary file first and then atomically moved, so that 
+        # concurrent or interrupted runs never leave a truncated cache file
+        import tempfile
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                np.savez(tmp_file, vertices=vertices, triangles=triangles)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        return vertices, triangles
+
     def get_wave_terrain(self, 
             terrain_size = 40,
             num_waves = 10, 
@@ -48,23 +86,31 @@ class RlTerrains():
         num_rows = int(terrain_width/horizontal_scale)
         num_cols = int(terrain_length/horizontal_scale)
 
-        heightfield = np.zeros((num_terrains * num_rows, 
-                                num_cols), dtype=np.int16)
+        def generate():
 
-        def new_sub_terrain(): 
+            heightfield = np.zeros((num_terrains * num_rows, 
+                                    num_cols), dtype=np.int16)
 
-            return SubTerrain(width=num_rows, 
-                        length=num_cols,
-                        vertical_scale=vertical_scale, 
-                        horizontal_scale=horizontal_scale)
+            def new_sub_terrain(): 
 
-        heightfield[0:num_rows, :] = wave_terrain(new_sub_terrain(), num_waves=num_waves, 
-                                                    amplitude=amplitude).height_field_raw
+                return SubTerrain(width=num_rows, 
+                            length=num_cols,
+                            vertical_scale=vertical_scale, 
+                            horizontal_scale=horizontal_scale)
+
+            heightfield[0:num_rows, :] = wave_terrain(new_sub_terrain(), num_waves=num_waves, 
+                                                        amplitude=amplitude).height_field_raw
         
-        vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
-                                    horizontal_scale=horizontal_scale,
-                                    vertical_scale=vertical_scale, 
-                                    slope_threshold=1.5)
+            vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
+                                        horizontal_scale=horizontal_scale,
+                                        vertical_scale=vertical_scale, 
+                                        slope_threshold=1.5)
+
+            return vertices, triangles
+
+        vertices, triangles = self._get_trimesh("wave", 
+                                    dict(terrain_size=terrain_size, num_waves=num_waves, amplitude=amplitude), 
+                                    generate)
 
         position = np.array([-terrain_width/2.0, terrain_length/2.0, 0]) + position
 
@@ -91,23 +137,31 @@ class RlTerrains():
         num_rows = int(terrain_width/horizontal_scale)
         num_cols = int(terrain_length/horizontal_scale)
 
-        heightfield = np.zeros((num_terrains * num_rows, 
-                                num_cols), dtype=np.int16)
+        def generate():
 
-        def new_sub_terrain(): 
+            heightfield = np.zeros((num_terrains * num_rows, 
+                                    num_cols), dtype=np.int16)
 
-            return SubTerrain(width=num_rows, 
-                        length=num_cols,
-                        vertical_scale=vertical_scale, 
-                        horizontal_scale=horizontal_scale)
+            def new_sub_terrain(): 
 
-        heightfield[0:num_rows, :] = pyramid_sloped_terrain(new_sub_terrain(), 
-                                        slope=slope).height_field_raw
+                return SubTerrain(width=num_rows, 
+                            length=num_cols,
+                            vertical_scale=vertical_scale, 
+                            horizontal_scale=horizontal_scale)
+
+            heightfield[0:num_rows, :] = pyramid_sloped_terrain(new_sub_terrain(), 
+                                            slope=slope).height_field_raw
     
-        vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
-                                    horizontal_scale=horizontal_scale,
-                                    vertical_scale=vertical_scale, 
-                                    slope_threshold=1.5)
+            vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
+                                        horizontal_scale=horizontal_scale,
+                                        vertical_scale=vertical_scale, 
+                                        slope_threshold=1.5)
+
+            return vertices, triangles
+
+        vertices, triangles = self._get_trimesh("sloped", 
+                                    dict(terrain_size=terrain_size, slope=slope), 
+                                    generate)
 
         position = np.array([-terrain_width/2.0, terrain_length/2.0, 0]) + position
 
@@ -135,23 +189,31 @@ class RlTerrains():
         num_rows = int(terrain_width/horizontal_scale)
         num_cols = int(terrain_length/horizontal_scale)
 
-        heightfield = np.zeros((num_terrains * num_rows, 
-                                num_cols), dtype=np.int16)
+        def generate():
+
+            heightfield = np.zeros((num_terrains * num_rows, 
+                                    num_cols), dtype=np.int16)
 
-        def new_sub_terrain(): 
+            def new_sub_terrain(): 
 
-            return SubTerrain(width=num_rows, 
-                        length=num_cols,
-                        vertical_scale=vertical_scale, 
-                        horizontal_scale=horizontal_scale)
+                return SubTerrain(width=num_rows, 
+                            length=num_cols,
+                            vertical_scale=vertical_scale, 
+                            horizontal_scale=horizontal_scale)
 
-        heightfield[0:num_rows, :] = stairs_terrain(new_sub_terrain(), step_width=step_width, 
-                                                    step_height=step_height).height_field_raw
+            heightfield[0:num_rows, :] = stairs_terrain(new_sub_terrain(), step_width=step_width, 
+                                                        step_height=step_height).height_field_raw
         
-        vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
-                                    horizontal_scale=horizontal_scale,
-                                    vertical_scale=vertical_scale, 
-                                    slope_threshold=1.5)
+            vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
+                                        horizontal_scale=horizontal_scale,
+                                        vertical_scale=vertical_scale, 
+                                        slope_threshold=1.5)
+
+            return vertices, triangles
+
+        vertices, triangles = self._get_trimesh("stairs", 
+                                    dict(terrain_size=terrain_size, step_width=step_width, step_height=step_height), 
+                                    generate)
 
         position = np.array([-terrain_width/2.0, terrain_length/2.0, 0]) + position
 
@@ -181,25 +243,34 @@ class RlTerrains():
         num_rows = int(terrain_width/horizontal_scale)
         num_cols = int(terrain_length/horizontal_scale)
 
-        heightfield = np.zeros((num_terrains * num_rows, 
-                                num_cols), dtype=np.int16)
+        def generate():
+
+            heightfield = np.zeros((num_terrains * num_rows, 
+                                    num_cols), dtype=np.int16)
 
-        def new_sub_terrain(): 
+            def new_sub_terrain(): 
 
-            return SubTerrain(width=num_rows, 
-                        length=num_cols,
-                        vertical_scale=vertical_scale, 
-                        horizontal_scale=horizontal_scale)
+                return SubTerrain(width=num_rows, 
+                            length=num_cols,
+                            vertical_scale=vertical_scale, 
+                            horizontal_scale=horizontal_scale)
 
-        heightfield[0:num_rows, :] = random_uniform_terrain(new_sub_terrain(), 
-                                            min_height=min_height, max_height=max_height, 
-                                            step=step, 
-                                            downsampled_scale=downsampled_scale).height_field_raw
+            heightfield[0:num_rows, :] = random_uniform_terrain(new_sub_terrain(), 
+                                                min_height=min_height, max_height=max_height, 
+                                                step=step, 
+                                                downsampled_scale=downsampled_scale).height_field_raw
         
-        vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
-                                    horizontal_scale=horizontal_scale,
-                                    vertical_scale=vertical_scale, 
-                                    slope_threshold=1.5)
+            vertices, triangles = convert_heightfield_to_trimesh(heightfield, 
+                                        horizontal_scale=horizontal_scale,
+                                        vertical_scale=vertical_scale, 
+                                        slope_threshold=1.5)
+
+            return vertices, triangles
+
+        vertices, triangles = self._get_trimesh("random", 
+                                    dict(terrain_size=terrain_size, min_height=min_height, max_height=max_height, 
+                                        step=step, downsampled_scale=downsampled_scale), 
+                                    generate)
 
         position = np.array([-terrain_width/2.0, terrain_length/2.0, 0]) + position
 
@@ -227,18 +298,27 @@ class RlTerrains():
         vertical_scale = 0.005  # [m]
         num_rows = int(terrain_width/horizontal_scale)
         num_cols = int(terrain_length/horizontal_scale)
-        heightfield = np.zeros((num_terains*num_rows, num_cols), dtype=np.int16)
+        def generate():
+
+            heightfield = np.zeros((num_terains*num_rows, num_cols), dtype=np.int16)
+
+            def new_sub_terrain(): 
+                return SubTerrain(width=num_rows, length=num_cols, vertical_scale=vertical_scale, horizontal_scale=horizontal_scale)
+
+            heightfield[0:num_rows, :] = discrete_obstacles_terrain(new_sub_terrain(), 
+                                                max_height=max_height, 
+                                                min_size=min_size, 
+                                                max_size=max_size,
+                                                num_rects=num_obs).height_field_raw
 
-        def new_sub_terrain(): 
-            return SubTerrain(width=num_rows, length=num_cols, vertical_scale=vertical_scale, horizontal_scale=horizontal_scale)
+            vertices, triangles = convert_heightfield_to_trimesh(heightfield, horizontal_scale=horizontal_scale, vertical_scale=vertical_scale, slope_threshold=1.5)
 
-        heightfield[0:num_rows, :] = discrete_obstacles_terrain(new_sub_terrain(), 
-                                            max_height=max_height, 
-                                            min_size=min_size, 
-                                            max_size=max_size,
-                                            num_rects=num_obs).height_field_raw
+            return vertices, triangles
 
-        vertices, triangles = convert_heightfield_to_trimesh(heightfield, horizontal_scale=horizontal_scale, vertical_scale=vertical_scale, slope_threshold=1.5)
+        vertices, triangles = self._get_trimesh("obstacles", 
+                                    dict(terrain_size=terrain_size, num_obs=num_obs, max_height=max_height, 
+                                        min_size=min_size, max_size=max_size), 
+                                    generate)
 
         position = np.array([-terrain_width/2.0, terrain_length/2.0, 0]) + position
 